@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Git Multi Benchmark
+
+Mede como descoberta, status e branches antigas do git_multi.py escalam com
+o número de repositórios. Gera N repos locais sintéticos (branches, commits
+e arquivos sujos configuráveis) em um diretório temporário, sem rede.
+
+Reporta, por tamanho e cenário: tempo total, processos git disparados,
+processos por repo e tempo somado dos processos (via `GitProfiler`).
+
+Uso:
+    python core/scripts/git/git_benchmark.py
+    python core/scripts/git/git_benchmark.py --sizes 10,100 --scenarios status,status-serial
+    python core/scripts/git/git_benchmark.py --branches 10 --commits 20 --dirty-ratio 0.5
+    python core/scripts/git/git_benchmark.py --jobs 8 --json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import git_multi
+
+# Repos por subdiretório (a descoberta percorre 2 níveis, como ~/Projetos/<grupo>/<repo>)
+REPOS_PER_GROUP = 50
+
+# Idade (dias) dos commits das branches extras: todas contam como antigas
+STALE_BRANCH_AGE = 90
+
+# (preparação fora da medição, execução medida)
+Scenario = Tuple[Optional[Callable[[List[Path]], None]], Callable[[List[Path]], int]]
+
+
+def git(cwd: Path, *args: str, date: str = "") -> None:
+    """Executa um comando git do gerador (falha interrompe o benchmark)."""
+    env = dict(os.environ, GIT_AUTHOR_NAME="bench", GIT_AUTHOR_EMAIL="bench@example.com")
+    env.update(GIT_COMMITTER_NAME="bench", GIT_COMMITTER_EMAIL="bench@example.com")
+    if date:
+        env.update(GIT_AUTHOR_DATE=date, GIT_COMMITTER_DATE=date)
+    subprocess.run(["git", *args], cwd=cwd, env=env, check=True, capture_output=True)
+
+
+def build_template(path: Path, branches: int, commits: int) -> None:
+    """
+    Cria o repo modelo: `commits` commits na main e `branches` branches antigas.
+
+    Os demais repos são cópias do modelo: gerar 500 repos com `git commit`
+    custaria mais que o próprio benchmark.
+    """
+    path.mkdir(parents=True)
+    git(path, "init", "-q", "-b", "main")
+    for index in range(commits):
+        (path / "file.txt").write_text(f"{index}\n")
+        git(path, "add", "file.txt")
+        git(path, "commit", "-q", "-m", f"commit {index}")
+
+    old = (datetime.now() - timedelta(days=STALE_BRANCH_AGE)).isoformat(timespec="seconds")
+    for index in range(branches):
+        git(path, "checkout", "-q", "-b", f"feature-{index}", "main")
+        (path / f"feature-{index}.txt").write_text("wip\n")
+        git(path, "add", f"feature-{index}.txt")
+        git(path, "commit", "-q", "-m", f"feature {index}", date=old)
+    git(path, "checkout", "-q", "main")
+
+
+def generate_repos(
+    root: Path, count: int, template: Path, dirty_ratio: float, dirty_files: int
+) -> List[Path]:
+    """Copia o modelo `count` vezes e suja uma fração dos repos."""
+    repos = []
+    dirty_every = round(1 / dirty_ratio) if dirty_ratio > 0 else 0
+    for index in range(count):
+        repo = root / f"group-{index // REPOS_PER_GROUP:02d}" / f"repo-{index:04d}"
+        shutil.copytree(template, repo, symlinks=True)
+        if dirty_every and index % dirty_every == 0:
+            (repo / "file.txt").write_text("modified\n")
+            for number in range(dirty_files - 1):
+                (repo / f"untracked-{number}.txt").write_text("new\n")
+        repos.append(repo)
+    return repos
+
+
+@contextmanager
+def profiled() -> Iterator[git_multi.GitProfiler]:
+    """Ativa o `GitProfiler` do git_multi durante um cenário."""
+    profiler = git_multi.GitProfiler()
+    git_multi.GIT_PROFILER = profiler
+    try:
+        yield profiler
+    finally:
+        git_multi.GIT_PROFILER = None
+
+
+def scenarios(root: Path, jobs: int, cache_dir: Path) -> Dict[str, Scenario]:
+    """
+    Cenários do benchmark: (preparação, execução medida).
+
+    A preparação roda fora da medição (ex: aquecer os caches); a execução
+    recebe os repos e retorna quantos itens processou.
+    """
+    status_cache_path = cache_dir / "git-status.json"
+
+    def warm_discovery(_repos: List[Path]) -> None:
+        git_multi.find_git_repos([root], refresh=True)
+
+    def warm_status_cache(repos: List[Path]) -> None:
+        cache = git_multi.StatusCache(path=status_cache_path)
+        probe = partial(git_multi.get_repo_status_cached, cache=cache)
+        git_multi.probe_repos(repos, probe, jobs=jobs)
+        cache.save()
+
+    def discovery(_repos: List[Path]) -> int:
+        return len(git_multi.find_git_repos([root], refresh=True))
+
+    def discovery_cached(_repos: List[Path]) -> int:
+        return len(git_multi.find_git_repos([root]))
+
+    def status_serial(repos: List[Path]) -> int:
+        return len(git_multi.probe_repos(repos, git_multi.get_repo_status, jobs=1))
+
+    def status(repos: List[Path]) -> int:
+        return len(git_multi.probe_repos(repos, git_multi.get_repo_status, jobs=jobs))
+
+    def status_cached(repos: List[Path]) -> int:
+        cache = git_multi.StatusCache(path=status_cache_path)
+        probe = partial(git_multi.get_repo_status_cached, cache=cache)
+        return len(git_multi.probe_repos(repos, probe, jobs=jobs))
+
+    def stale_branches(repos: List[Path]) -> int:
+        results = git_multi.probe_repos(repos, git_multi.get_branch_info, jobs=jobs)
+        return sum(1 for branches in results for branch in branches if branch["days_old"] > 30)
+
+    return {
+        "discovery": (None, discovery),
+        "discovery-cached": (warm_discovery, discovery_cached),
+        "status-serial": (None, status_serial),
+        "status": (None, status),
+        "status-cached": (warm_status_cache, status_cached),
+        "stale-branches": (None, stale_branches),
+    }
+
+
+# Nomes na ordem da tabela (montá-la só cria os closures, sem tocar o disco)
+SCENARIO_NAMES = list(scenarios(Path(), 1, Path()))
+
+
+def run_scenario(scenario: Scenario, repos: List[Path]) -> Dict[str, Any]:
+    """Executa um cenário medindo tempo e processos git (sem a preparação)."""
+    setup, run = scenario
+    if setup:
+        setup(repos)
+
+    with profiled() as profiler:
+        started = time.perf_counter()
+        items = run(repos)
+        wall = time.perf_counter() - started
+
+    return {
+        "wall": wall,
+        "items": items,
+        "spawns": profiler.spawns,
+        "spawns_per_repo": profiler.spawns / len(repos) if repos else 0.0,
+        "git_time": sum(entry["duration"] for entry in profiler.records),
+    }
+
+
+def print_report(rows: List[Dict[str, Any]]) -> None:
+    """Tabela com os resultados."""
+    print(f"\n{'='*88}")
+    print("BENCHMARK GIT_MULTI (repos sintéticos locais)")
+    print(f"{'='*88}\n")
+    print(f"{'Repos':>6} {'Cenário':<17} {'Tempo (s)':>10} {'Itens':>7} "
+          f"{'Processos git':>14} {'Proc/repo':>10} {'Git (s)':>9}")
+    print("-" * 88)
+    for row in rows:
+        print(
+            f"{row['repos']:>6} {row['scenario']:<17} {row['wall']:>10.3f} {row['items']:>7} "
+            f"{row['spawns']:>14} {row['spawns_per_repo']:>10.2f} {row['git_time']:>9.2f}"
+        )
+    print("\nNota: os cenários -cached medem a passada com o cache já aquecido.")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark do git_multi.py com repositórios sintéticos locais",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplos:
+  %(prog)s
+  %(prog)s --sizes 10,100 --scenarios status,status-serial
+  %(prog)s --branches 10 --commits 20 --dirty-ratio 0.5
+  %(prog)s --jobs 8 --json
+        """,
+    )
+    parser.add_argument(
+        "--sizes", default="10,100,500", help="Repos gerados por execução (default: 10,100,500)"
+    )
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIO_NAMES),
+        help=f"Cenários a executar (default: {','.join(SCENARIO_NAMES)})",
+    )
+    parser.add_argument(
+        "--branches", type=int, default=5, help="Branches antigas por repo (default: 5)"
+    )
+    parser.add_argument(
+        "--commits", type=int, default=10, help="Commits na main de cada repo (default: 10)"
+    )
+    parser.add_argument(
+        "--dirty-ratio",
+        type=float,
+        default=0.3,
+        help="Fração dos repos com alterações (default: 0.3)",
+    )
+    parser.add_argument(
+        "--dirty-files",
+        type=int,
+        default=3,
+        help="Arquivos alterados por repo sujo (1 modificado + N-1 novos, default: 3)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=git_multi.DEFAULT_JOBS,
+        help=f"Paralelismo dos cenários paralelos (default: {git_multi.DEFAULT_JOBS})",
+    )
+    parser.add_argument("--keep", action="store_true", help="Manter o diretório gerado")
+    parser.add_argument("--json", action="store_true", help="Saída em JSON")
+
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    names = [name for name in args.scenarios.split(",") if name]
+    unknown = [name for name in names if name not in SCENARIO_NAMES]
+    if unknown:
+        parser.error(f"Cenários desconhecidos: {', '.join(unknown)}")
+    if args.commits < 1:
+        parser.error("--commits precisa ser >= 1")
+
+    workdir = Path(tempfile.mkdtemp(prefix="git-multi-bench-"))
+    # Caches do git_multi isolados no diretório temporário (não tocar ~/.cache)
+    git_multi.REPO_CACHE_PATH = workdir / "cache" / "git-repos.json"
+
+    rows = []
+    try:
+        if not args.json:
+            print(f"⏳ Gerando repo modelo em {workdir}...", flush=True)
+        template = workdir / "template"
+        build_template(template, args.branches, args.commits)
+
+        for size in sizes:
+            root = workdir / f"repos-{size}"
+            if not args.json:
+                print(f"⏳ {size} repos: gerando...", flush=True)
+            repos = generate_repos(root, size, template, args.dirty_ratio, args.dirty_files)
+            cache_dir = workdir / "cache" / str(size)
+            available = scenarios(root, args.jobs, cache_dir)
+
+            for name in names:
+                if not args.json:
+                    print(f"⏳ {size} repos: {name}...", flush=True)
+                metrics = run_scenario(available[name], repos)
+                rows.append({"repos": size, "scenario": name, **metrics})
+    finally:
+        if args.keep:
+            print(f"📁 Repos mantidos em {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_report(rows)
+
+
+if __name__ == "__main__":
+    main()
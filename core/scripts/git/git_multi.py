@@ -12,14 +12,28 @@ Uso:
     python core/scripts/git/git_multi.py --pull            # Pull em todos
     python core/scripts/git/git_multi.py --stale-branches  # Branches antigas
     python core/scripts/git/git_multi.py --uncommitted     # Repos com mudanças
+    python core/scripts/git/git_multi.py --watch           # Daemon de status por inotify
 """
 
 import argparse
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import json
+import os
 import subprocess
+import select
+import signal
+import struct
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 # Configurações
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -41,157 +55,788 @@ IGNORED_REPOS = [
     ".venv",
 ]
 
+# Cache da descoberta de repos (revalidado pelos mtimes dos diretórios)
+CACHE_DIR = Path.home() / ".cache" / "cursor-multiagent"
+REPO_CACHE_PATH = CACHE_DIR / "git-repos.json"
+REPO_CACHE_VERSION = 1
+
+# Cache do status por repo (--cached), validado pelos mtimes de index/HEAD/refs
+# e dos arquivos rastreados
+STATUS_CACHE_PATH = CACHE_DIR / "git-status.json"
+STATUS_CACHE_VERSION = 3
+DEFAULT_STATUS_CACHE_TTL = 300
+
+# Tabela de status mantida pelo --watch (lida por --from-watch)
+WATCH_STATE_PATH = CACHE_DIR / "git-watch.json"
+WATCH_STATE_VERSION = 2
+
+# Diretórios de build/cache não observados pelo --watch (além de IGNORED_REPOS):
+# costumam ter milhares de subdiretórios e só mudam em builds
+WATCH_IGNORED_DIRS = set(IGNORED_REPOS) | {
+    "dist",
+    "build",
+    "target",
+    "coverage",
+    "htmlcov",
+    ".next",
+    ".nuxt",
+    ".tox",
+    ".nox",
+    ".cache",
+    ".gradle",
+    ".terraform",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+}
+
+# Espera sem eventos (s) antes de reconsultar um repo; intervalo de polling sem inotify
+WATCH_DEBOUNCE = 0.5
+DEFAULT_WATCH_INTERVAL = 60
+
+# Repos sondados em paralelo (sobrescrever com --jobs)
+DEFAULT_JOBS = min(32, (os.cpu_count() or 4) * 2)
+
+# Tempo máximo (segundos) de todos os comandos git de um repo (--repo-timeout)
+DEFAULT_REPO_TIMEOUT = 30
+
+# Limites de paralelismo e timeout (segundos) das operações de rede
+DEFAULT_FETCH_JOBS = 8
+DEFAULT_PULL_JOBS = 4
+DEFAULT_NETWORK_TIMEOUT = 120
+
+# Linhas da tabela de repos mais lentos (fetch/pull)
+SLOWEST_SHOWN = 10
+
+T = TypeVar("T")
+
+
+class GitProfiler:
+    """
+    Registro dos processos git disparados por `run_git_command` (`--profile`).
 
-def run_git_command(repo_path: Path, *args: str, timeout: int = 30) -> Tuple[bool, str]:
+    Guarda argv, cwd, duração e código de saída de cada processo (None em
+    timeout ou git ausente). Thread-safe: os repos são sondados em paralelo.
+    """
+
+    def __init__(self):
+        self.records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(
+        self, argv: List[str], cwd: Path, duration: float, returncode: Optional[int]
+    ) -> None:
+        """Registra um processo concluído."""
+        entry = {"argv": argv, "cwd": str(cwd), "duration": duration, "returncode": returncode}
+        with self._lock:
+            self.records.append(entry)
+
+    @property
+    def spawns(self) -> int:
+        """Total de processos git disparados."""
+        return len(self.records)
+
+    def by_subcommand(self) -> Dict[str, Dict[str, float]]:
+        """Quantidade e tempo somado por subcomando git (`status`, `log`, `fetch`...)."""
+        summary: Dict[str, Dict[str, float]] = {}
+        with self._lock:
+            records = list(self.records)
+        for entry in records:
+            stats = summary.setdefault(entry["argv"][1], {"count": 0, "total": 0.0})
+            stats["count"] += 1
+            stats["total"] += entry["duration"]
+        return summary
+
+    def report(self, top: int = SLOWEST_SHOWN, file: Any = sys.stderr) -> None:
+        """Total de processos, tempo por subcomando e os `top` processos mais lentos."""
+        with self._lock:
+            records = list(self.records)
+        total = sum(entry["duration"] for entry in records)
+
+        print(f"\n{'='*70}", file=file)
+        print(f"PROFILE: {len(records)} processos git, {total:.2f}s somados", file=file)
+        print(f"{'='*70}", file=file)
+        if not records:
+            return
+
+        subcommands = sorted(self.by_subcommand().items(), key=lambda x: -x[1]["total"])
+        for name, stats in subcommands:
+            print(
+                f"   {name:<16} {int(stats['count']):>6}x {stats['total']:>9.2f}s "
+                f"(média {stats['total'] / stats['count'] * 1000:.1f}ms)",
+                file=file,
+            )
+
+        print(f"\n⏱️  {min(top, len(records))} processos mais lentos:", file=file)
+        for entry in sorted(records, key=lambda x: -x["duration"])[:top]:
+            code = "⏱️" if entry["returncode"] is None else entry["returncode"]
+            command = " ".join(entry["argv"][1:])
+            print(
+                f"   {entry['duration']:>7.3f}s {code!s:>3} {Path(entry['cwd']).name[:24]:<24} "
+                f"{command[:60]}",
+                file=file,
+            )
+
+
+# Ativado por --profile (ou por quem importa o módulo, ex: git_benchmark.py)
+GIT_PROFILER: Optional[GitProfiler] = None
+
+
+def run_git_command(
+    repo_path: Path, *args: str, timeout: float = 30, env: Optional[Dict[str, str]] = None
+) -> Tuple[bool, str]:
     """
     Executa comando git em um repositório.
 
+    Com `GIT_PROFILER` ativo, registra argv, cwd, duração e código de saída.
+
+    Args:
+        env: Ambiente do processo (default: herdado)
+
     Returns:
         Tuple de (sucesso, output)
     """
+    argv = ["git", *args]
+    returncode: Optional[int] = None
+    started = time.perf_counter()
     try:
         result = subprocess.run(
-            ["git", *args],
+            argv,
             cwd=repo_path,
             capture_output=True,
             text=True,
             timeout=timeout,
+            env=env,
         )
+        returncode = result.returncode
         return result.returncode == 0, result.stdout.strip()
     except subprocess.TimeoutExpired:
         return False, "TIMEOUT"
     except FileNotFoundError:
         return False, "GIT NOT FOUND"
+    finally:
+        profiler = GIT_PROFILER
+        if profiler is not None:
+            profiler.record(argv, repo_path, time.perf_counter() - started, returncode)
+
+
+def remaining(deadline: float) -> float:
+    """Segundos restantes até o deadline de um repo (mínimo simbólico: o git falha rápido)."""
+    return max(deadline - time.monotonic(), 0.01)
+
+
+def probe_repos(
+    repos: List[Path],
+    probe: Callable[..., T],
+    jobs: int = DEFAULT_JOBS,
+    timeout: float = DEFAULT_REPO_TIMEOUT,
+) -> List[T]:
+    """
+    Executa `probe(repo, timeout=...)` em paralelo.
+
+    Cada repo tem seu próprio timeout: um repo travado ocupa só um worker
+    e não atrasa os demais além disso.
+
+    Returns:
+        Resultados na mesma ordem de `repos` (saída determinística)
+    """
+    if jobs <= 1 or len(repos) <= 1:
+        return [probe(repo, timeout=timeout) for repo in repos]
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(repos))) as executor:
+        return list(executor.map(lambda repo: probe(repo, timeout=timeout), repos))
+
+
+def iter_probe(
+    repos: List[Path],
+    probe: Callable[..., T],
+    jobs: int = DEFAULT_JOBS,
+    timeout: float = DEFAULT_REPO_TIMEOUT,
+) -> Iterator[Tuple[Path, T]]:
+    """
+    Como `probe_repos`, mas produz (repo, resultado) na ordem de conclusão.
+
+    Usado no streaming (`--format ndjson`): o primeiro repo pronto sai
+    sem esperar o mais lento.
+    """
+    if jobs <= 1 or len(repos) <= 1:
+        for repo in repos:
+            yield repo, probe(repo, timeout=timeout)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(repos))) as executor:
+        futures = {executor.submit(probe, repo, timeout=timeout): repo for repo in repos}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def emit_records(records: Iterable[Dict[str, Any]], fmt: str) -> None:
+    """Escreve registros como um array JSON (`json`) ou um JSON por linha (`ndjson`)."""
+    if fmt == "ndjson":
+        for record in records:
+            print(json.dumps(record, ensure_ascii=False), flush=True)
+    else:
+        print(json.dumps(list(records), ensure_ascii=False, indent=2))
+
 
+def status_record(status: Dict[str, Any]) -> Dict[str, Any]:
+    """Status de um repo como registro JSON (`--format json/ndjson`)."""
+    return {"path": str(status["path"]), **status_to_json(status)}
 
-def find_git_repos(base_dirs: List[Path], max_depth: int = 3) -> List[Path]:
-    """Encontra repositórios git nos diretórios base."""
+
+def statuses_for_output(
+    repos: List[Path], args: argparse.Namespace
+) -> Iterable[Dict[str, Any]]:
+    """Status para saída estruturada: em streaming com ndjson, na ordem dos repos com json."""
+    probe = status_probe(args)
+    if args.format == "ndjson":
+        return (status for _, status in iter_probe(repos, probe, args.jobs, args.repo_timeout))
+    return probe_repos(repos, probe, args.jobs, args.repo_timeout)
+
+
+def scan_git_repos(base_dir: Path, max_depth: int = 3) -> Tuple[List[Path], Dict[str, int]]:
+    """
+    Percorre `base_dir` com `os.scandir` procurando repositórios.
+
+    Diretórios em IGNORED_REPOS são podados antes de descer, e a busca
+    não entra em um repo encontrado (o primeiro `.git` de cada ramo da árvore).
+
+    Returns:
+        Tuple de (repos, mtime em ns de cada diretório listado) — os mtimes
+        validam o cache: criar/remover um repo altera o mtime do diretório pai
+    """
     repos = []
+    mtimes: Dict[str, int] = {}
+    stack = [(base_dir, 0)]
 
-    for base_dir in base_dirs:
-        if not base_dir.exists():
+    while stack:
+        directory, depth = stack.pop()
+        try:
+            mtimes[str(directory)] = directory.stat().st_mtime_ns
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
             continue
 
-        for path in base_dir.rglob(".git"):
-            # Verificar profundidade
+        subdirs = []
+        is_repo = False
+        for entry in entries:
             try:
-                relative = path.relative_to(base_dir)
-                if len(relative.parts) > max_depth:
+                if not entry.is_dir(follow_symlinks=False):
                     continue
-            except ValueError:
+            except OSError:
                 continue
+            if entry.name == ".git":
+                is_repo = True
+                break
+            if entry.name not in IGNORED_REPOS:
+                subdirs.append(entry.path)
 
-            # Verificar se é diretório .git (não arquivo)
-            if not path.is_dir():
-                continue
+        if is_repo:
+            repos.append(directory)
+        elif depth + 1 < max_depth:
+            stack.extend((Path(path), depth + 1) for path in subdirs)
+
+    return repos, mtimes
+
+
+def load_repo_cache() -> Dict[str, Any]:
+    """Lê o cache de descoberta (vazio se ausente ou corrompido)."""
+    try:
+        data = json.loads(REPO_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if data.get("version") == REPO_CACHE_VERSION else {}
 
-            # Ignorar certos padrões
-            repo_path = path.parent
-            if any(ignored in str(repo_path) for ignored in IGNORED_REPOS):
-                continue
 
-            repos.append(repo_path)
+def save_repo_cache(cache: Dict[str, Any]) -> None:
+    """Grava o cache de descoberta de forma atômica."""
+    try:
+        REPO_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = REPO_CACHE_PATH.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(cache))
+        tmp_path.replace(REPO_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def cache_is_fresh(entry: Dict[str, Any]) -> bool:
+    """True se nenhum diretório listado na última varredura mudou de mtime."""
+    for directory, mtime in entry["dirs"].items():
+        try:
+            if os.stat(directory).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def find_git_repos(
+    base_dirs: List[Path], max_depth: int = 3, use_cache: bool = True, refresh: bool = False
+) -> List[Path]:
+    """
+    Encontra repositórios git nos diretórios base.
+
+    Com `use_cache`, reaproveita a última varredura de cada diretório base
+    enquanto os mtimes dos diretórios listados não mudarem (um `stat` por
+    diretório em vez de percorrer a árvore). `refresh` força a varredura
+    e regrava o cache.
+    """
+    repos = []
+    cache = load_repo_cache() if use_cache and not refresh else {}
+    bases = cache.setdefault("bases", {})
+    ignored = sorted(IGNORED_REPOS)
+    changed = False
+
+    for base_dir in base_dirs:
+        if not base_dir.exists():
+            continue
+
+        key = str(base_dir.resolve())
+        entry = bases.get(key)
+        valid = (
+            entry is not None
+            and entry.get("max_depth") == max_depth
+            and entry.get("ignored") == ignored
+            and cache_is_fresh(entry)
+        )
+        if not valid:
+            found, mtimes = scan_git_repos(base_dir, max_depth)
+            entry = {
+                "max_depth": max_depth,
+                "ignored": ignored,
+                "dirs": mtimes,
+                "repos": [str(path) for path in found],
+            }
+            bases[key] = entry
+            changed = True
+
+        repos.extend(Path(path) for path in entry["repos"])
+
+    if use_cache and changed:
+        cache["version"] = REPO_CACHE_VERSION
+        save_repo_cache(cache)
 
     return sorted(set(repos))
 
 
-def get_repo_status(repo_path: Path) -> Dict[str, Any]:
-    """Obtém status completo de um repositório."""
+def parse_status_v2(output: str) -> Dict[str, Any]:
+    """
+    Interpreta `git status --porcelain=v2 --branch`.
+
+    Returns:
+        Dict com `branch`, `oid`, `upstream`, `ahead`, `behind` e `changes`
+        (entradas alteradas, em conflito ou não rastreadas)
+    """
+    info: Dict[str, Any] = {
+        "branch": "unknown",
+        "oid": None,
+        "upstream": None,
+        "ahead": 0,
+        "behind": 0,
+        "changes": 0,
+    }
+    for line in output.split("\n"):
+        if not line:
+            continue
+        if not line.startswith("# "):
+            info["changes"] += 1
+            continue
+
+        parts = line.split()
+        header = parts[1] if len(parts) > 1 else ""
+        if header == "branch.head" and len(parts) > 2:
+            info["branch"] = "detached" if parts[2] == "(detached)" else parts[2]
+        elif header == "branch.oid" and len(parts) > 2:
+            info["oid"] = None if parts[2] == "(initial)" else parts[2]
+        elif header == "branch.upstream" and len(parts) > 2:
+            info["upstream"] = parts[2]
+        elif header == "branch.ab" and len(parts) > 3:
+            info["ahead"] = int(parts[2].lstrip("+"))
+            info["behind"] = int(parts[3].lstrip("-"))
+    return info
+
+
+def get_repo_status(repo_path: Path, timeout: float = DEFAULT_REPO_TIMEOUT) -> Dict[str, Any]:
+    """
+    Obtém status completo de um repositório (todos os comandos dentro de `timeout`).
+
+    Dois processos git: `status --porcelain=v2 --branch` (branch, upstream,
+    ahead/behind e alterações) e um `log -1` com hash, assunto e data.
+    """
+    deadline = time.monotonic() + timeout
     status = {
         "path": repo_path,
         "name": repo_path.name,
     }
 
-    # Branch atual
-    success, branch = run_git_command(repo_path, "branch", "--show-current")
-    status["branch"] = branch if success else "unknown"
-
-    # Status (alterações)
-    success, changes = run_git_command(repo_path, "status", "--porcelain")
+    # Branch, alterações e commits não pushados em uma chamada
+    success, output = run_git_command(
+        repo_path, "status", "--porcelain=v2", "--branch", timeout=remaining(deadline)
+    )
     if success:
-        change_list = [c for c in changes.split("\n") if c]
-        status["uncommitted"] = len(change_list)
-        status["is_clean"] = len(change_list) == 0
+        info = parse_status_v2(output)
+        status["branch"] = info["branch"]
+        status["uncommitted"] = info["changes"]
+        status["is_clean"] = info["changes"] == 0
+        status["unpushed"] = info["ahead"]  # 0 sem upstream
+        status["behind"] = info["behind"]
     else:
+        info = {"oid": None}
+        status["branch"] = "unknown"
         status["uncommitted"] = -1
         status["is_clean"] = False
+        status["unpushed"] = 0
+        status["behind"] = 0
+
+    # Último commit (resumo e data); repo sem commits não tem o que consultar.
+    # Data absoluta (%ct): a idade relativa é calculada na exibição, já que o
+    # status pode vir do cache ou da tabela do --watch
+    status["last_commit"] = "N/A"
+    status["last_commit_date"] = None
+    if info["oid"] or not success:
+        success, last_commit = run_git_command(
+            repo_path, "log", "-1", "--format=%h %s%x00%ct", timeout=remaining(deadline)
+        )
+        if success and "\0" in last_commit:
+            summary, commit_time = last_commit.rsplit("\0", 1)
+            status["last_commit"] = summary
+            try:
+                status["last_commit_date"] = datetime.fromtimestamp(int(commit_time))
+            except (ValueError, OverflowError, OSError):
+                pass
 
-    # Commits não pushados
-    success, unpushed = run_git_command(repo_path, "log", "--oneline", "@{u}..HEAD")
-    if success:
-        unpushed_list = [c for c in unpushed.split("\n") if c]
-        status["unpushed"] = len(unpushed_list)
-    else:
-        status["unpushed"] = 0  # Pode não ter upstream
+    status["timed_out"] = time.monotonic() >= deadline
+    return status
 
-    # Último commit
-    success, last_commit = run_git_command(repo_path, "log", "-1", "--format=%h %s (%ar)")
-    status["last_commit"] = last_commit if success else "N/A"
 
-    # Data do último commit
-    success, commit_date = run_git_command(repo_path, "log", "-1", "--format=%ci")
-    if success:
+def relative_age(when: datetime, now: Optional[datetime] = None) -> str:
+    """Idade legível de uma data (ex: "há 3 dias"), como o `%ar` do git."""
+    seconds = max(int(((now or datetime.now()) - when).total_seconds()), 0)
+    for limit, size, singular, plural in (
+        (90, 1, "segundo", "segundos"),
+        (90 * 60, 60, "minuto", "minutos"),
+        (36 * 3600, 3600, "hora", "horas"),
+        (14 * 86400, 86400, "dia", "dias"),
+        (10 * 7 * 86400, 7 * 86400, "semana", "semanas"),
+        (365 * 86400, 30 * 86400, "mês", "meses"),
+    ):
+        if seconds < limit:
+            count = round(seconds / size)
+            return f"há {count} {singular if count == 1 else plural}"
+    count = round(seconds / (365 * 86400))
+    return f"há {count} {'ano' if count == 1 else 'anos'}"
+
+
+def describe_last_commit(status: Dict[str, Any]) -> str:
+    """Resumo do último commit com a idade calculada agora."""
+    if not status["last_commit_date"]:
+        return status["last_commit"]
+    return f"{status['last_commit']} ({relative_age(status['last_commit_date'])})"
+
+
+def read_index_paths(index_path: Path) -> Optional[List[bytes]]:
+    """
+    Caminhos rastreados listados no `.git/index` (versões 2, 3 e 4).
+
+    Returns:
+        Caminhos relativos à raiz do repo (bytes, como gravados no index),
+        ou None se o index não puder ser lido
+    """
+    try:
+        data = index_path.read_bytes()
+    except OSError:
+        return None
+    if len(data) < 12 or data[:4] != b"DIRC":
+        return None
+
+    version, count = struct.unpack(">II", data[4:12])
+    if version not in (2, 3, 4):
+        return None
+
+    paths: List[bytes] = []
+    previous = b""
+    offset = 12
+    try:
+        for _ in range(count):
+            # ctime, mtime, dev, ino, mode, uid, gid, size (40 bytes) + oid (20) + flags
+            (flags,) = struct.unpack(">H", data[offset + 60:offset + 62])
+            start = offset + 62
+            if version >= 3 and flags & 0x4000:
+                start += 2  # flags estendidos
+
+            if version == 4:
+                # Prefixo comprimido: varint com quantos bytes remover do caminho anterior
+                strip = data[start] & 0x7F
+                while data[start] & 0x80:
+                    start += 1
+                    strip = ((strip + 1) << 7) | (data[start] & 0x7F)
+                start += 1
+                end = data.index(b"\0", start)
+                name = previous[:len(previous) - strip] + data[start:end]
+                offset = end + 1
+            else:
+                end = data.index(b"\0", start)
+                name = data[start:end]
+                # Entrada ocupa múltiplo de 8 bytes (1 a 8 NULs de padding)
+                offset += (end - offset + 8) & ~7
+
+            previous = name
+            paths.append(name)
+    except (struct.error, IndexError, ValueError):
+        return None
+    return paths
+
+
+def worktree_signature(repo_path: Path, paths: List[bytes]) -> str:
+    """
+    Digest do mtime e tamanho dos arquivos rastreados e dos diretórios que
+    os contêm (arquivos novos/removidos mudam o mtime do diretório).
+    """
+    # Caminhos em bytes, sem Path: em repos com dezenas de milhares de
+    # arquivos a montagem dos caminhos custaria mais que os próprios stats
+    root = os.fsencode(repo_path) + b"/"
+    stats: List[int] = []
+    directories = {b""}
+    for path in paths:
         try:
-            status["last_commit_date"] = datetime.fromisoformat(commit_date.split()[0])
-        except (ValueError, IndexError):
-            status["last_commit_date"] = None
-    else:
-        status["last_commit_date"] = None
+            info = os.lstat(root + path)
+            stats += (info.st_mtime_ns, info.st_size)
+        except OSError:
+            stats += (-1, -1)
+        directories.add(path.rpartition(b"/")[0])
+
+    for directory in sorted(directories):
+        try:
+            stats.append(os.stat(root + directory).st_mtime_ns)
+        except OSError:
+            stats.append(-1)
+    return hashlib.blake2b(struct.pack(f"<{len(stats)}q", *stats), digest_size=16).hexdigest()
+
+
+def repo_state_key(repo_path: Path) -> Optional[List[Any]]:
+    """
+    Assinatura barata do estado de um repo (só `stat`, sem processos git).
+
+    Combina o conteúdo de `.git/HEAD` com os mtimes de `.git/index`, `HEAD`,
+    do arquivo da branch atual, `packed-refs` e `FETCH_HEAD`, mais o mtime e
+    o tamanho de cada arquivo rastreado no index e o mtime dos diretórios
+    que os contêm. Arquivos novos em diretórios sem nenhum arquivo rastreado
+    e edições que preservam mtime e tamanho não mudam a assinatura (por isso
+    o cache tem TTL).
+
+    Returns:
+        Lista serializável, ou None se `.git` não for um diretório
+    """
+    git_dir = repo_path / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+
+    paths = [git_dir / "index", git_dir / "HEAD", git_dir / "packed-refs", git_dir / "FETCH_HEAD"]
+    if head.startswith("ref: "):
+        paths.append(git_dir / head[len("ref: "):])
+
+    key: List[Any] = [head]
+    for path in paths:
+        try:
+            key.append(path.stat().st_mtime_ns)
+        except OSError:
+            key.append(None)
+
+    tracked = read_index_paths(git_dir / "index")
+    key.append(worktree_signature(repo_path, tracked) if tracked is not None else None)
+    return key
+
 
+def status_to_json(status: Dict[str, Any]) -> Dict[str, Any]:
+    """Status de `get_repo_status` em formato serializável (sem `path`, data em ISO)."""
+    data = {name: value for name, value in status.items() if name != "path"}
+    if data["last_commit_date"]:
+        data["last_commit_date"] = data["last_commit_date"].isoformat()
+    return data
+
+
+def status_from_json(data: Dict[str, Any], repo_path: Path) -> Dict[str, Any]:
+    """Inverso de `status_to_json`."""
+    status = dict(data, path=repo_path)
+    if status["last_commit_date"]:
+        status["last_commit_date"] = datetime.fromisoformat(status["last_commit_date"])
+    return status
+
+
+class StatusCache:
+    """
+    Cache em disco de `get_repo_status` por repo, validado por `repo_state_key`.
+
+    Entradas expiram após `ttl` segundos mesmo com a assinatura igual.
+    Thread-safe: usado pelos workers de `probe_repos`.
+    """
+
+    def __init__(self, path: Path = STATUS_CACHE_PATH, ttl: float = DEFAULT_STATUS_CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._changed = False
+        self._lock = threading.Lock()
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        self.entries: Dict[str, Dict[str, Any]] = (
+            data.get("repos", {}) if data.get("version") == STATUS_CACHE_VERSION else {}
+        )
+
+    def get(self, repo_path: Path, key: Optional[List[Any]]) -> Optional[Dict[str, Any]]:
+        """Status em cache se a assinatura bate e a entrada não expirou."""
+        with self._lock:
+            entry = self.entries.get(str(repo_path))
+            fresh = (
+                key is not None
+                and entry is not None
+                and entry["key"] == key
+                and time.time() - entry["cached_at"] < self.ttl
+            )
+            if not fresh:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        return status_from_json(entry["status"], repo_path)
+
+    def put(self, repo_path: Path, key: Optional[List[Any]], status: Dict[str, Any]) -> None:
+        """Guarda o status (ignorado sem assinatura ou se o status ficou incompleto)."""
+        if key is None or status["timed_out"] or status["uncommitted"] < 0:
+            return
+
+        stored = status_to_json(status)
+        with self._lock:
+            self.entries[str(repo_path)] = {"key": key, "cached_at": time.time(), "status": stored}
+            self._changed = True
+
+    def save(self) -> None:
+        """Grava o cache de forma atômica (só se algo mudou)."""
+        with self._lock:
+            if not self._changed:
+                return
+            data = json.dumps({"version": STATUS_CACHE_VERSION, "repos": self.entries})
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(data)
+            tmp_path.replace(self.path)
+        except OSError:
+            pass
+
+
+def get_repo_status_cached(
+    repo_path: Path, timeout: float = DEFAULT_REPO_TIMEOUT, cache: Optional[StatusCache] = None
+) -> Dict[str, Any]:
+    """`get_repo_status` servido pelo `StatusCache` quando o repo não mudou."""
+    if cache is None:
+        return get_repo_status(repo_path, timeout)
+
+    cached = cache.get(repo_path, repo_state_key(repo_path))
+    if cached is not None:
+        return cached
+
+    status = get_repo_status(repo_path, timeout)
+    # Assinatura lida depois: `git status` pode reescrever o index ao atualizá-lo
+    cache.put(repo_path, repo_state_key(repo_path), status)
     return status
 
 
-def get_branch_info(repo_path: Path) -> List[Dict[str, Any]]:
-    """Obtém informações sobre branches."""
+def get_repo_status_watched(
+    repo_path: Path,
+    timeout: float = DEFAULT_REPO_TIMEOUT,
+    table: Optional[Dict[str, Dict[str, Any]]] = None,
+    cache: Optional[StatusCache] = None,
+) -> Dict[str, Any]:
+    """Status lido da tabela do `--watch`; repos fora da tabela são consultados no git."""
+    entry = (table or {}).get(str(repo_path))
+    if entry is not None:
+        return status_from_json(entry, repo_path)
+    return get_repo_status_cached(repo_path, timeout, cache)
+
+
+def status_probe(args: argparse.Namespace) -> Callable[..., Dict[str, Any]]:
+    """Função de status para `probe_repos` (tabela do --watch, cache se --cached)."""
+    if args.watch_table is not None:
+        return partial(get_repo_status_watched, table=args.watch_table, cache=args.status_cache)
+    return partial(get_repo_status_cached, cache=args.status_cache)
+
+
+def get_branch_info(
+    repo_path: Path, timeout: float = DEFAULT_REPO_TIMEOUT, include_remote: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Obtém informações sobre branches com um único `git for-each-ref`.
+
+    Args:
+        repo_path: Repositório
+        timeout: Tempo máximo do comando
+        include_remote: Incluir branches remotas (`refs/remotes`, exceto `*/HEAD`)
+    """
     branches = []
 
-    # Listar branches locais
-    success, output = run_git_command(repo_path, "branch", "-v", "--no-abbrev")
+    refs = ["refs/heads"] + (["refs/remotes"] if include_remote else [])
+    success, output = run_git_command(
+        repo_path,
+        "for-each-ref",
+        "--format=%(refname)%00%(refname:short)%00%(objectname)%00%(committerdate:short)%00%(HEAD)",
+        *refs,
+        timeout=timeout,
+    )
     if not success:
         return branches
 
+    now = datetime.now()
     for line in output.split("\n"):
-        if not line.strip():
+        fields = line.split("\0")
+        if len(fields) != 5:
             continue
 
-        is_current = line.startswith("*")
-        line = line.lstrip("* ")
-        parts = line.split()
-
-        if len(parts) >= 2:
-            branch_name = parts[0]
-            commit_hash = parts[1]
+        refname, branch_name, commit_hash, commit_date, head = fields
+        is_remote = refname.startswith("refs/remotes/")
+        if is_remote and refname.endswith("/HEAD"):
+            continue
 
-            # Data do último commit na branch
-            success, commit_date = run_git_command(
-                repo_path, "log", "-1", "--format=%ci", branch_name
-            )
-            if success:
-                try:
-                    date = datetime.fromisoformat(commit_date.split()[0])
-                    days_old = (datetime.now() - date).days
-                except (ValueError, IndexError):
-                    date = None
-                    days_old = -1
-            else:
-                date = None
-                days_old = -1
-
-            branches.append(
-                {
-                    "name": branch_name,
-                    "commit": commit_hash[:8],
-                    "is_current": is_current,
-                    "last_commit_date": date,
-                    "days_old": days_old,
-                }
-            )
+        try:
+            date = datetime.fromisoformat(commit_date)
+            days_old = (now - date).days
+        except ValueError:
+            date = None
+            days_old = -1
+
+        branches.append(
+            {
+                "name": branch_name,
+                "commit": commit_hash[:8],
+                "is_current": head == "*",
+                "is_remote": is_remote,
+                "last_commit_date": date,
+                "days_old": days_old,
+            }
+        )
 
     return branches
 
 
 def cmd_status(repos: List[Path], args: argparse.Namespace) -> None:
     """Mostra status de todos os repositórios."""
+    if args.format != "text":
+        emit_records(
+            (
+                status_record(status)
+                for status in statuses_for_output(repos, args)
+                if not args.dirty_only or not status["is_clean"] or status["unpushed"]
+            ),
+            args.format,
+        )
+        return
+
     print(f"\n{'='*70}")
     print(f"STATUS DE {len(repos)} REPOSITÓRIOS")
     print(f"{'='*70}\n")
@@ -199,9 +844,7 @@ def cmd_status(repos: List[Path], args: argparse.Namespace) -> None:
     clean_repos = []
     dirty_repos = []
 
-    for repo_path in repos:
-        status = get_repo_status(repo_path)
-
+    for status in probe_repos(repos, status_probe(args), args.jobs, args.repo_timeout):
         if status["is_clean"] and status["unpushed"] == 0:
             clean_repos.append(status)
         else:
@@ -217,6 +860,8 @@ def cmd_status(repos: List[Path], args: argparse.Namespace) -> None:
                 print(f"   ⚠️ {status['uncommitted']} alterações não commitadas")
             if status["unpushed"] > 0:
                 print(f"   ⚠️ {status['unpushed']} commits não pushados")
+            if status["timed_out"]:
+                print(f"   ⏱️ Timeout após {args.repo_timeout}s (status incompleto)")
             print(f"   📍 {status['path']}")
             print()
 
@@ -224,57 +869,161 @@ def cmd_status(repos: List[Path], args: argparse.Namespace) -> None:
     if clean_repos and not args.dirty_only:
         print("## ✅ Repositórios limpos\n")
         for status in clean_repos:
-            print(f"✅ {status['name']} ({status['branch']}) - {status['last_commit']}")
+            print(f"✅ {status['name']} ({status['branch']}) - {describe_last_commit(status)}")
 
     # Sumário
     print(f"\n{'='*70}")
     print(f"SUMÁRIO: {len(clean_repos)} limpos, {len(dirty_repos)} com alterações")
+    if args.status_cache:
+        cache = args.status_cache
+        print(f"Cache: {cache.hits} repos inalterados, {cache.misses} consultados")
     print(f"{'='*70}")
 
 
+def run_network_op(
+    repos: List[Path], git_args: Tuple[str, ...], jobs: int, timeout: float
+) -> List[Dict[str, Any]]:
+    """
+    Executa um comando git de rede (fetch/pull) nos repos em paralelo.
+
+    Mostra uma linha de progresso atualizada a cada repo concluído.
+
+    Returns:
+        Resultados na ordem de `repos` (`path`, `name`, `success`, `output`, `elapsed`)
+    """
+    # Sem prompt de credenciais: um repo HTTPS sem credencial falharia só no
+    # --network-timeout, segurando um worker do pool até lá
+    env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+    def run(repo_path: Path) -> Dict[str, Any]:
+        started = time.monotonic()
+        success, output = run_git_command(repo_path, *git_args, timeout=timeout, env=env)
+        return {
+            "path": repo_path,
+            "name": repo_path.name,
+            "success": success,
+            "output": output,
+            "elapsed": time.monotonic() - started,
+        }
+
+    results: Dict[Path, Dict[str, Any]] = {}
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(min(jobs, len(repos)), 1)) as executor:
+        futures = [executor.submit(run, repo_path) for repo_path in repos]
+        for future in as_completed(futures):
+            result = future.result()
+            results[result["path"]] = result
+            failed += 0 if result["success"] else 1
+            print(
+                f"\r⏳ {len(results)}/{len(repos)} concluídos, {failed} falhas "
+                f"(último: {result['name'][:30]})".ljust(70),
+                end="",
+                flush=True,
+            )
+    if repos:
+        print("\n")
+    return [results[repo_path] for repo_path in repos]
+
+
+def print_durations(results: List[Dict[str, Any]]) -> None:
+    """Tabela dos repos mais lentos (remotes lentos aparecem no topo)."""
+    if not results:
+        return
+
+    slowest = sorted(results, key=lambda x: -x["elapsed"])[:SLOWEST_SHOWN]
+    total = sum(result["elapsed"] for result in results)
+    print(f"\n⏱️  Repos mais lentos ({len(results)} repos, {total:.1f}s somados):")
+    for result in slowest:
+        mark = "✅" if result["success"] else "❌"
+        print(f"   {mark} {result['name']:<40} {result['elapsed']:>7.2f}s")
+
+
 def cmd_fetch(repos: List[Path], args: argparse.Namespace) -> None:
     """Executa fetch em todos os repositórios."""
     print(f"\n{'='*70}")
-    print(f"FETCH EM {len(repos)} REPOSITÓRIOS")
+    print(f"FETCH EM {len(repos)} REPOSITÓRIOS ({args.fetch_jobs} em paralelo)")
     print(f"{'='*70}\n")
 
-    for repo_path in repos:
-        print(f"⏳ Fetching {repo_path.name}...", end=" ", flush=True)
-        success, output = run_git_command(repo_path, "fetch", "--all", "--prune")
-        if success:
-            print("✅")
-        else:
-            print(f"❌ {output}")
+    results = run_network_op(
+        repos, ("fetch", "--all", "--prune"), args.fetch_jobs, args.network_timeout
+    )
+    for result in results:
+        if not result["success"]:
+            print(f"❌ {result['name']}: {result['output']}")
+
+    ok = sum(1 for result in results if result["success"])
+    print(f"✅ {ok} repos atualizados, {len(results) - ok} falhas")
+    print_durations(results)
 
 
 def cmd_pull(repos: List[Path], args: argparse.Namespace) -> None:
     """Executa pull em todos os repositórios."""
     print(f"\n{'='*70}")
-    print(f"PULL EM {len(repos)} REPOSITÓRIOS")
+    print(f"PULL EM {len(repos)} REPOSITÓRIOS ({args.pull_jobs} em paralelo)")
     print(f"{'='*70}\n")
 
-    for repo_path in repos:
-        status = get_repo_status(repo_path)
-
-        # Só fazer pull em repos limpos
-        if not status["is_clean"]:
-            print(f"⏭️ Skipping {repo_path.name} (tem alterações não commitadas)")
-            continue
+    # Só fazer pull em repos limpos (sem cache: decide se o working tree será alterado)
+    clean = []
+    for status in probe_repos(repos, get_repo_status, args.jobs, args.repo_timeout):
+        if status["timed_out"]:
+            print(f"⏭️ Skipping {status['name']} (status não concluído em {args.repo_timeout}s)")
+        elif status["uncommitted"] < 0:
+            print(f"⏭️ Skipping {status['name']} (falha ao ler o status)")
+        elif status["is_clean"]:
+            clean.append(status["path"])
+        else:
+            print(f"⏭️ Skipping {status['name']} (tem alterações não commitadas)")
+    if len(clean) < len(repos):
+        print()
 
-        print(f"⏳ Pulling {repo_path.name}...", end=" ", flush=True)
-        success, output = run_git_command(repo_path, "pull", "--ff-only")
-        if success:
-            if "Already up to date" in output:
-                print("✅ Já atualizado")
-            else:
-                print("✅ Atualizado")
+    results = run_network_op(clean, ("pull", "--ff-only"), args.pull_jobs, args.network_timeout)
+    for result in results:
+        if not result["success"]:
+            print(f"❌ {result['name']}: {result['output'][:50]}...")
+        elif "Already up to date" in result["output"]:
+            print(f"✅ {result['name']}: Já atualizado")
         else:
-            print(f"❌ {output[:50]}...")
+            print(f"✅ {result['name']}: Atualizado")
+
+    print_durations(results)
 
 
 def cmd_stale_branches(repos: List[Path], args: argparse.Namespace) -> None:
     """Lista branches antigas/esquecidas."""
     stale_days = args.stale_days or 30
+    scan = partial(get_branch_info, include_remote=args.include_remote)
+
+    if args.format != "text":
+        if args.format == "ndjson":
+            results: Iterable[Tuple[Path, List[Dict[str, Any]]]] = iter_probe(
+                repos, scan, args.jobs, args.repo_timeout
+            )
+        else:
+            results = zip(repos, probe_repos(repos, scan, args.jobs, args.repo_timeout))
+
+        def records() -> Iterator[Dict[str, Any]]:
+            for repo_path, branches in results:
+                stale = [b for b in branches if b["days_old"] > stale_days and not b["is_current"]]
+                if not stale:
+                    continue
+                yield {
+                    "name": repo_path.name,
+                    "path": str(repo_path),
+                    "stale_branches": [
+                        {
+                            **branch,
+                            "last_commit_date": (
+                                branch["last_commit_date"].date().isoformat()
+                                if branch["last_commit_date"]
+                                else None
+                            ),
+                        }
+                        for branch in sorted(stale, key=lambda x: -x["days_old"])
+                    ],
+                }
+
+        emit_records(records(), args.format)
+        return
 
     print(f"\n{'='*70}")
     print(f"BRANCHES > {stale_days} DIAS SEM ATIVIDADE")
@@ -282,15 +1031,16 @@ def cmd_stale_branches(repos: List[Path], args: argparse.Namespace) -> None:
 
     total_stale = 0
 
-    for repo_path in repos:
-        branches = get_branch_info(repo_path)
+    all_branches = probe_repos(repos, scan, args.jobs, args.repo_timeout)
+    for repo_path, branches in zip(repos, all_branches):
         stale = [b for b in branches if b["days_old"] > stale_days and not b["is_current"]]
 
         if stale:
             print(f"## {repo_path.name}")
             for branch in sorted(stale, key=lambda x: -x["days_old"]):
                 age_emoji = "🔴" if branch["days_old"] > 90 else "🟠"
-                print(f"  {age_emoji} {branch['name']}: {branch['days_old']} dias")
+                remote = " (remota)" if branch["is_remote"] else ""
+                print(f"  {age_emoji} {branch['name']}{remote}: {branch['days_old']} dias")
             print()
             total_stale += len(stale)
 
@@ -304,15 +1054,23 @@ def cmd_stale_branches(repos: List[Path], args: argparse.Namespace) -> None:
 
 def cmd_uncommitted(repos: List[Path], args: argparse.Namespace) -> None:
     """Lista apenas repos com mudanças não commitadas."""
+    if args.format != "text":
+        emit_records(
+            (
+                status_record(status)
+                for status in statuses_for_output(repos, args)
+                if not status["is_clean"]
+            ),
+            args.format,
+        )
+        return
+
     print(f"\n{'='*70}")
     print("REPOSITÓRIOS COM MUDANÇAS NÃO COMMITADAS")
     print(f"{'='*70}\n")
 
-    dirty = []
-    for repo_path in repos:
-        status = get_repo_status(repo_path)
-        if not status["is_clean"]:
-            dirty.append(status)
+    statuses = probe_repos(repos, status_probe(args), args.jobs, args.repo_timeout)
+    dirty = [status for status in statuses if not status["is_clean"]]
 
     if not dirty:
         print("✅ Todos os repositórios estão limpos!")
@@ -326,6 +1084,288 @@ def cmd_uncommitted(repos: List[Path], args: argparse.Namespace) -> None:
         print()
 
 
+class Inotify:
+    """
+    Wrapper mínimo do inotify do Linux via ctypes (sem dependências externas).
+
+    Levanta OSError se o inotify não estiver disponível (ex: macOS) ou se o
+    limite de watches (`fs.inotify.max_user_watches`) for atingido.
+    """
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    IN_CLOEXEC = 0x00080000
+
+    # Qualquer mudança de conteúdo ou de entradas em um diretório
+    CHANGE_MASK = (
+        IN_MODIFY
+        | IN_ATTRIB
+        | IN_CLOSE_WRITE
+        | IN_MOVED_FROM
+        | IN_MOVED_TO
+        | IN_CREATE
+        | IN_DELETE
+        | IN_DELETE_SELF
+        | IN_ONLYDIR
+    )
+
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self):
+        if not hasattr(ctypes, "CDLL") or not sys.platform.startswith("linux"):
+            raise OSError("inotify disponível apenas no Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(self.IN_CLOEXEC)
+        if self.fd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code))
+
+    def add_watch(self, path: Path, mask: int = CHANGE_MASK) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(path)), mask)
+        if wd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code), str(path))
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        """Remove um watch (erros ignorados: o diretório pode já ter sumido)."""
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read(self, timeout: float) -> List[Tuple[int, int, str]]:
+        """Eventos pendentes como (wd, mask, nome); lista vazia se `timeout` expirar."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        data = os.read(self.fd, 64 * 1024)
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def watch_tree(
+    inotify: Inotify, repo_path: Path, root: Path, watches: Dict[int, Tuple[Path, Path, bool]]
+) -> None:
+    """
+    Registra watches em `root` e subdiretórios (WATCH_IGNORED_DIRS podados).
+
+    Dentro do `.git`, só a raiz e `refs/` interessam (HEAD, refs, FETCH_HEAD).
+    """
+    git_dir = repo_path / ".git"
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        in_git = directory == git_dir or git_dir in directory.parents
+        watches[inotify.add_watch(directory)] = (repo_path, directory, in_git)
+        try:
+            with os.scandir(directory) as it:
+                entries = [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            continue
+        for entry in entries:
+            path = Path(entry.path)
+            if path == git_dir:
+                stack.append(path)
+            elif in_git:
+                if path == git_dir / "refs" or (git_dir / "refs") in path.parents:
+                    stack.append(path)
+            elif entry.name not in WATCH_IGNORED_DIRS:
+                stack.append(path)
+
+
+def unwatch_repo(
+    inotify: Inotify, repo_path: Path, watches: Dict[int, Tuple[Path, Path, bool]]
+) -> None:
+    """Remove todos os watches de um repo (ex: antes de passá-lo para polling)."""
+    for wd in [wd for wd, (path, _, _) in watches.items() if path == repo_path]:
+        inotify.rm_watch(wd)
+        del watches[wd]
+
+
+def relevant_event(in_git: bool, name: str) -> bool:
+    """Ignora o que o próprio `git status` escreve no `.git` (index e locks)."""
+    if not in_git:
+        return True
+    return name != "index" and not name.endswith(".lock")
+
+
+def write_watch_state(table: Dict[str, Dict[str, Any]]) -> None:
+    """Grava a tabela do --watch de forma atômica (lida por --from-watch)."""
+    WATCH_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = WATCH_STATE_PATH.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {
+                "version": WATCH_STATE_VERSION,
+                "pid": os.getpid(),
+                "updated_at": time.time(),
+                "repos": table,
+            }
+        )
+    )
+    tmp_path.replace(WATCH_STATE_PATH)
+
+
+def load_watch_state() -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Tabela do --watch, ou None se o processo do watch não estiver rodando
+    (ou for de uma versão com outro formato de tabela).
+    """
+    try:
+        data = json.loads(WATCH_STATE_PATH.read_text())
+        os.kill(data["pid"], 0)
+    except (OSError, ValueError, KeyError):
+        return None
+    if data.get("version") != WATCH_STATE_VERSION:
+        return None
+    return data.get("repos", {})
+
+
+def describe_status(status: Dict[str, Any]) -> str:
+    """Linha curta de status para o log do --watch."""
+    if status["is_clean"] and status["unpushed"] == 0:
+        return f"✅ {status['name']} ({status['branch']}) limpo"
+    details = []
+    if status["uncommitted"] > 0:
+        details.append(f"{status['uncommitted']} alterações")
+    if status["unpushed"] > 0:
+        details.append(f"{status['unpushed']} não pushados")
+    summary = ", ".join(details) or "status incompleto"
+    return f"🟠 {status['name']} ({status['branch']}): {summary}"
+
+
+def cmd_watch(repos: List[Path], args: argparse.Namespace) -> None:
+    """Mantém a tabela de status atualizada por eventos do filesystem."""
+    print(f"\n{'='*70}")
+    print(f"WATCH EM {len(repos)} REPOSITÓRIOS")
+    print(f"{'='*70}\n")
+
+    statuses = probe_repos(repos, get_repo_status, args.jobs, args.repo_timeout)
+    table = {str(status["path"]): status_to_json(status) for status in statuses}
+    write_watch_state(table)
+
+    watches: Dict[int, Tuple[Path, Path, bool]] = {}
+    polled: List[Path] = []
+    try:
+        inotify: Optional[Inotify] = Inotify()
+    except OSError as e:
+        print(f"⚠️ inotify indisponível ({e}); usando polling a cada {args.watch_interval}s")
+        inotify = None
+        polled = list(repos)
+
+    if inotify:
+        for index, repo_path in enumerate(repos):
+            try:
+                watch_tree(inotify, repo_path, repo_path, watches)
+            except OSError as e:
+                # Repo meio observado perderia eventos: sai inteiro para polling
+                unwatch_repo(inotify, repo_path, watches)
+                if e.errno != errno.ENOSPC:
+                    print(f"⚠️ {repo_path.name}: {e.strerror}; usando polling")
+                    polled.append(repo_path)
+                    continue
+                # Limite de watches: os repos seguintes falhariam do mesmo jeito
+                polled.extend(repos[index:])
+                print(f"⚠️ Limite de watches do inotify atingido em {repo_path.name} "
+                      f"(fs.inotify.max_user_watches): {len(repos) - index} repos "
+                      f"por polling a cada {args.watch_interval}s")
+                break
+
+    dirty = sum(1 for status in statuses if not status["is_clean"] or status["unpushed"])
+    print(f"👀 {len(repos) - len(polled)} repos com inotify ({len(watches)} diretórios), "
+          f"{len(polled)} por polling; {dirty} com alterações")
+    print(f"📄 Estado em {WATCH_STATE_PATH} (consultar com --status --from-watch)\n")
+
+    pending: Dict[Path, float] = {}
+    next_poll = time.monotonic() + args.watch_interval
+    # SIGTERM (ex: systemd) também passa pelo finally e remove o arquivo de estado
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        while True:
+            now = time.monotonic()
+            timeout = min(next_poll - now, WATCH_DEBOUNCE if pending else args.watch_interval)
+            if inotify:
+                events = inotify.read(max(timeout, 0))
+            else:
+                time.sleep(max(timeout, 0))
+                events = []
+
+            now = time.monotonic()
+            for wd, mask, name in events:
+                if mask & Inotify.IN_Q_OVERFLOW:
+                    pending.update((repo_path, now) for repo_path in repos)
+                    continue
+                if wd not in watches:
+                    continue
+                repo_path, directory, in_git = watches[wd]
+                if mask & Inotify.IN_IGNORED:
+                    del watches[wd]
+                    continue
+                if not relevant_event(in_git, name):
+                    continue
+                created = mask & (Inotify.IN_CREATE | Inotify.IN_MOVED_TO)
+                new_dir = mask & Inotify.IN_ISDIR and created
+                if new_dir and not in_git and name not in WATCH_IGNORED_DIRS:
+                    try:
+                        watch_tree(inotify, repo_path, directory / name, watches)
+                    except OSError as e:
+                        if e.errno == errno.ENOSPC:
+                            unwatch_repo(inotify, repo_path, watches)
+                            polled.append(repo_path)
+                            print(f"⚠️ Limite de watches do inotify atingido em "
+                                  f"{repo_path.name}; usando polling", flush=True)
+                pending[repo_path] = now
+
+            if polled and now >= next_poll:
+                pending.update((repo_path, now) for repo_path in polled)
+                next_poll = now + args.watch_interval
+            elif not polled:
+                next_poll = now + args.watch_interval
+
+            # Debounce: reconsulta só depois de um intervalo sem novos eventos
+            ready = [repo for repo, last in pending.items() if now - last >= WATCH_DEBOUNCE]
+            if not ready:
+                continue
+            for repo_path in ready:
+                del pending[repo_path]
+
+            for status in probe_repos(ready, get_repo_status, args.jobs, args.repo_timeout):
+                previous = table.get(str(status["path"]), {})
+                table[str(status["path"])] = status_to_json(status)
+                fields = ("branch", "uncommitted", "unpushed", "behind", "is_clean")
+                if any(previous.get(field) != status[field] for field in fields):
+                    print(f"{datetime.now():%H:%M:%S} {describe_status(status)}", flush=True)
+            write_watch_state(table)
+    except KeyboardInterrupt:
+        print("\n👋 Watch encerrado.")
+    finally:
+        if inotify:
+            inotify.close()
+        try:
+            WATCH_STATE_PATH.unlink()
+        except OSError:
+            pass
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Gerenciador de múltiplos repositórios git",
@@ -338,6 +1378,10 @@ Exemplos:
   %(prog)s --pull             # Pull em repos limpos
   %(prog)s --stale-branches   # Branches antigas
   %(prog)s --uncommitted      # Repos com mudanças
+  %(prog)s --status --jobs 16 # Status com 16 repos em paralelo
+  %(prog)s --watch            # Daemon: status atualizado por inotify
+  %(prog)s --status --from-watch  # Status instantâneo a partir do --watch
+  %(prog)s --fetch --profile  # Processos git mais lentos ao final
         """,
     )
 
@@ -352,8 +1396,20 @@ Exemplos:
     action.add_argument(
         "--uncommitted", action="store_true", help="Listar repos com mudanças"
     )
+    action.add_argument(
+        "--watch",
+        action="store_true",
+        help="Manter o status atualizado por eventos do filesystem (inotify)",
+    )
 
     # Opções
+    parser.add_argument(
+        "--format",
+        choices=["text", "json", "ndjson"],
+        default="text",
+        help="Saída de --status/--stale-branches/--uncommitted "
+        "(ndjson: um repo por linha, assim que fica pronto)",
+    )
     parser.add_argument(
         "--dirty-only",
         action="store_true",
@@ -365,37 +1421,139 @@ Exemplos:
         default=30,
         help="Dias para considerar branch antiga (default: 30)",
     )
+    parser.add_argument(
+        "--include-remote",
+        action="store_true",
+        help="Incluir branches remotas (para --stale-branches)",
+    )
     parser.add_argument(
         "--add-dir",
         action="append",
         help="Adicionar diretório para escanear",
     )
+    parser.add_argument(
+        "--cached",
+        action="store_true",
+        help=(
+            "Reusar o status de repos cujo index/HEAD/refs e arquivos rastreados não mudaram "
+            "de mtime/tamanho (--status, --uncommitted); edições que preservam mtime e tamanho "
+            "só aparecem após --cache-ttl"
+        ),
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_STATUS_CACHE_TTL,
+        help=f"Validade do status em cache em segundos (default: {DEFAULT_STATUS_CACHE_TTL})",
+    )
+    parser.add_argument(
+        "--from-watch",
+        action="store_true",
+        help="Responder --status/--uncommitted pela tabela de um --watch em execução",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=DEFAULT_WATCH_INTERVAL,
+        help=f"Polling (s) para repos sem inotify (default: {DEFAULT_WATCH_INTERVAL})",
+    )
+    parser.add_argument(
+        "--rescan",
+        action="store_true",
+        help="Varrer os diretórios novamente e atualizar o cache de descoberta",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Repos processados em paralelo (default: {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--fetch-jobs",
+        type=int,
+        default=DEFAULT_FETCH_JOBS,
+        help=f"Fetches simultâneos (default: {DEFAULT_FETCH_JOBS})",
+    )
+    parser.add_argument(
+        "--pull-jobs",
+        type=int,
+        default=DEFAULT_PULL_JOBS,
+        help=f"Pulls simultâneos (default: {DEFAULT_PULL_JOBS})",
+    )
+    parser.add_argument(
+        "--network-timeout",
+        type=float,
+        default=DEFAULT_NETWORK_TIMEOUT,
+        help=f"Tempo máximo de cada fetch/pull em segundos (default: {DEFAULT_NETWORK_TIMEOUT})",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Registrar cada processo git e mostrar os mais lentos ao final (em stderr)",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=SLOWEST_SHOWN,
+        help=f"Processos listados pelo --profile (default: {SLOWEST_SHOWN})",
+    )
+    parser.add_argument(
+        "--repo-timeout",
+        type=float,
+        default=DEFAULT_REPO_TIMEOUT,
+        help=f"Tempo máximo por repo em segundos (default: {DEFAULT_REPO_TIMEOUT})",
+    )
 
     args = parser.parse_args()
 
+    global GIT_PROFILER
+    if args.profile:
+        GIT_PROFILER = GitProfiler()
+
     # Construir lista de diretórios
     scan_dirs = list(SCAN_DIRS)
     if args.add_dir:
         scan_dirs.extend(Path(d) for d in args.add_dir)
 
     # Encontrar repos
-    repos = find_git_repos(scan_dirs)
+    repos = find_git_repos(scan_dirs, refresh=args.rescan)
 
     if not repos:
-        print("Nenhum repositório git encontrado.")
+        # Com --format json/ndjson o stdout fica só com registros
+        output = sys.stdout if args.format == "text" else sys.stderr
+        print("Nenhum repositório git encontrado.", file=output)
         sys.exit(1)
 
+    args.status_cache = StatusCache(ttl=args.cache_ttl) if args.cached else None
+    args.watch_table = None
+    if args.from_watch:
+        args.watch_table = load_watch_state()
+        if args.watch_table is None:
+            print(
+                "⚠️ Nenhum --watch em execução; consultando os repos diretamente.",
+                file=sys.stderr,
+            )
+
     # Executar ação
-    if args.status:
-        cmd_status(repos, args)
-    elif args.fetch:
-        cmd_fetch(repos, args)
-    elif args.pull:
-        cmd_pull(repos, args)
-    elif args.stale_branches:
-        cmd_stale_branches(repos, args)
-    elif args.uncommitted:
-        cmd_uncommitted(repos, args)
+    try:
+        if args.status:
+            cmd_status(repos, args)
+        elif args.fetch:
+            cmd_fetch(repos, args)
+        elif args.pull:
+            cmd_pull(repos, args)
+        elif args.stale_branches:
+            cmd_stale_branches(repos, args)
+        elif args.uncommitted:
+            cmd_uncommitted(repos, args)
+        elif args.watch:
+            cmd_watch(repos, args)
+    finally:
+        if args.status_cache:
+            args.status_cache.save()
+        if GIT_PROFILER is not None:
+            GIT_PROFILER.report(args.profile_top)
 
 
 if __name__ == "__main__":
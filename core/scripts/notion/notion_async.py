@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Notion Async Client
+
+Variante asyncio do NotionBatch, com a mesma superfície de métodos
+(`query_database`, `iter_database`, `update_page`, `archive_page`).
+Várias databases e páginas podem ser buscadas ao mesmo tempo em um único
+event loop, compartilhando o pool de conexões e o rate limiter — e
+combinadas com outras operações de I/O sem bloquear umas às outras.
+
+Uso:
+    python core/scripts/notion/notion_async.py --database all
+    python core/scripts/notion/notion_async.py --database studies --max-connections 8
+
+Como biblioteca (executado a partir de core/scripts/notion/):
+    async with AsyncNotionBatch() as notion:
+        async for page in notion.iter_database(database_id):
+            print(notion.get_page_title(page))
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+try:
+    import aiohttp
+except ImportError:
+    print("aiohttp não encontrado. Instale com: pip install aiohttp")
+    sys.exit(1)
+
+from notion_batch import (
+    CircuitBreaker,
+    NotionAPIError,
+    NotionClientMixin,
+    RequestMetrics,
+    TokenBucket,
+    print_metrics,
+)
+
+
+class AsyncRateLimiter(TokenBucket):
+    """Token bucket para asyncio (mesma semântica do RateLimiter síncrono)."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        super().__init__(rate, burst)
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Aguarda até haver um token disponível (ou até o fim de uma pausa)."""
+        while True:
+            async with self._lock:
+                wait = self._take()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Suspende todas as requisições (ex: Retry-After de um 429)."""
+        self._block(seconds)
+
+
+class AsyncNotionBatch(NotionClientMixin):
+    """
+    Cliente asyncio para operações batch no Notion.
+
+    Token, headers, IDs das databases, cache de schema, política de retry,
+    hooks e extratores de página (`get_page_title`, `get_page_status`...)
+    vêm do `NotionClientMixin`.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        max_connections: int = 10,
+        timeout: int = 30,
+        rate_limit: float = 3.0,
+        max_retries: int = 5,
+        base_url: Optional[str] = None,
+    ):
+        """
+        Inicializa o cliente. A sessão HTTP é aberta em `async with`.
+
+        Args:
+            token: Notion API token. Se não fornecido, usa NOTION_API_KEY do ambiente.
+            max_connections: Máximo de conexões keep-alive simultâneas
+            timeout: Timeout (segundos) de cada requisição
+            rate_limit: Requisições por segundo (Notion permite ~3 req/s)
+            max_retries: Tentativas extras para 429, 5xx e erros de rede
+            base_url: URL da API (default: NOTION_API_BASE_URL ou a API oficial)
+        """
+        self._setup_client(token, base_url)
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+
+        self.circuit_breaker = CircuitBreaker()
+        self.request_count = 0
+        self.retry_count = 0
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.rate_limiter: Optional[AsyncRateLimiter] = None
+
+    async def __aenter__(self) -> "AsyncNotionBatch":
+        connector = aiohttp.TCPConnector(limit=self.max_connections, keepalive_timeout=60)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        self.rate_limiter = AsyncRateLimiter(self.rate_limit)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Fecha a sessão HTTP e libera as conexões do pool."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Dict:
+        """
+        Faz uma requisição à API do Notion (mesma política de retry e mesmos
+        eventos de hook do NotionBatch).
+
+        Returns:
+            JSON da resposta, ou {} em caso de falha
+        """
+        if self.session is None or self.rate_limiter is None:
+            raise RuntimeError("Sessão fechada: use 'async with AsyncNotionBatch() as notion'")
+
+        url = f"{self.base_url}/{endpoint}"
+        idempotent = self._is_idempotent(method, endpoint, idempotent)
+        body = json.dumps(data).encode() if data is not None else None
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            if not self.circuit_breaker.allow():
+                print(f"Erro na requisição: circuit breaker aberto ({method} {endpoint})")
+                return {}
+
+            waited = time.perf_counter()
+            await self.rate_limiter.acquire()
+            self.request_count += 1
+
+            # Evento da tentativa, entregue aos hooks mesmo em retry/erro
+            event: Dict[str, Any] = {
+                "method": method,
+                "endpoint": endpoint,
+                "attempt": attempt,
+                "ok": False,
+                "throttle_wait": time.perf_counter() - waited,
+            }
+            started = time.perf_counter()
+            try:
+                async with self.session.request(method, url, data=body) as response:
+                    status = response.status
+                    content = await response.read()
+                    event["elapsed"] = time.perf_counter() - started
+                    event["status"] = status
+                    event["bytes_sent"] = len(body or b"")
+                    event["bytes_received"] = len(content)
+                    self._record_status(status)
+                    if self._should_retry(status, idempotent, last_attempt):
+                        event["retry_delay"] = await self._wait_retry(attempt, response)
+                        continue
+
+                    if status >= 400:
+                        print(f"Erro na requisição: {status} para {method} {url}")
+                        print(f"Resposta: {content.decode(errors='replace')}")
+                        return {}
+
+                    decode_started = time.perf_counter()
+                    try:
+                        result = json.loads(content)
+                    except ValueError as e:
+                        print(f"Erro na requisição: resposta inválida para {method} {url} ({e})")
+                        return {}
+                    event["decode_time"] = time.perf_counter() - decode_started
+                    event["ok"] = True
+                    return result
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                event["elapsed"] = time.perf_counter() - started
+                event["error"] = type(e).__name__
+                self.circuit_breaker.record_failure()
+                if self._should_retry(None, idempotent, last_attempt):
+                    event["retry_delay"] = await self._wait_retry(attempt)
+                    continue
+                print(f"Erro na requisição: {e!r}")
+                return {}
+            except aiohttp.ClientError as e:
+                event["error"] = type(e).__name__
+                print(f"Erro na requisição: {e}")
+                return {}
+            finally:
+                self._emit(event)
+
+        return {}
+
+    async def _wait_retry(
+        self, attempt: int, response: Optional[aiohttp.ClientResponse] = None
+    ) -> float:
+        """
+        Aguarda antes de um retry: Retry-After se presente, senão backoff com jitter.
+
+        Returns:
+            Tempo aguardado por esta corrotina (em 429 o atraso vira pausa do
+            rate limiter e é medido como espera na próxima tentativa)
+        """
+        self.retry_count += 1
+
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        delay = self._retry_delay(attempt, retry_after)
+
+        if response is not None and response.status == 429:
+            # Limite global: pausa todas as corrotinas, não só a atual
+            self.rate_limiter.pause(delay)
+            return 0.0
+        await asyncio.sleep(delay)
+        return delay
+
+    async def retrieve_database(self, database_id: str) -> Dict:
+        """Obtém o objeto da database (inclui o schema das propriedades)."""
+        return await self._request("GET", f"databases/{database_id}")
+
+    async def get_properties(self, database_id: str) -> Dict:
+        """Retorna as propriedades da database (buscadas uma vez e cacheadas)."""
+        cached = self.cached_properties(database_id)
+        if cached is not None:
+            return cached
+
+        database = await self.retrieve_database(database_id)
+        properties = database.get("properties", {})
+        self.register_properties(database_id, properties)
+        return properties
+
+    async def get_schema(self, database_id: str) -> Dict[str, str]:
+        """Mapeia cada papel (`title`, `status`) para o nome da propriedade na database."""
+        await self.get_properties(database_id)
+        return self.cached_schema(database_id)
+
+    async def iter_database(
+        self,
+        database_id: str,
+        filter_obj: Optional[Dict] = None,
+        sorts: Optional[List[Dict]] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Dict]:
+        """
+        Consulta uma database, produzindo as páginas conforme cada lote chega.
+
+        Args:
+            database_id: ID da database
+            filter_obj: Filtro Notion
+            sorts: Ordenação
+            page_size: Tamanho da página
+
+        Yields:
+            Páginas/cards
+        """
+        data: Dict[str, Any] = {"page_size": page_size}
+        if filter_obj:
+            data["filter"] = filter_obj
+        if sorts:
+            data["sorts"] = sorts
+
+        has_more = True
+        start_cursor = None
+
+        while has_more:
+            if start_cursor:
+                data["start_cursor"] = start_cursor
+
+            response = await self._request("POST", f"databases/{database_id}/query", data)
+
+            # Não tratar falha como fim dos dados: resultados ficariam truncados
+            if not response:
+                raise NotionAPIError(f"Consulta à database {database_id} falhou após retries")
+
+            for page in response.get("results", []):
+                yield page
+            has_more = response.get("has_more", False)
+            start_cursor = response.get("next_cursor")
+
+    async def iter_pages(
+        self, database_id: str, filter_obj: Optional[Dict] = None
+    ) -> AsyncIterator[Dict]:
+        """Como `iter_database`, carregando antes o schema usado pelos extratores."""
+        await self.get_properties(database_id)
+        async for page in self.iter_database(database_id, filter_obj=filter_obj):
+            yield page
+
+    async def query_database(
+        self,
+        database_id: str,
+        filter_obj: Optional[Dict] = None,
+        sorts: Optional[List[Dict]] = None,
+        page_size: int = 100,
+    ) -> List[Dict]:
+        """
+        Consulta uma database do Notion.
+
+        Returns:
+            Lista de páginas/cards
+        """
+        return [
+            page async for page in self.iter_database(database_id, filter_obj, sorts, page_size)
+        ]
+
+    async def update_page(self, page_id: str, properties: Dict) -> Dict:
+        """Atualiza propriedades de uma página."""
+        return await self._request("PATCH", f"pages/{page_id}", {"properties": properties})
+
+    async def archive_page(self, page_id: str) -> Dict:
+        """Arquiva uma página."""
+        return await self._request("PATCH", f"pages/{page_id}", {"archived": True})
+
+    async def run_bulk(
+        self,
+        items: List[Any],
+        operation: Callable[[Any], Awaitable[Dict]],
+        concurrency: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """
+        Executa uma mutação em lote com concorrência limitada.
+
+        Returns:
+            Lista de resultados na mesma ordem de `items`
+            (`item`, `ok`, `response`, `error`)
+        """
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def run(item: Any) -> Dict[str, Any]:
+            async with semaphore:
+                error = None
+                try:
+                    response = await operation(item)
+                    if not response:
+                        error = "requisição falhou"
+                except Exception as e:
+                    response = {}
+                    error = str(e)
+            return {"item": item, "ok": error is None, "response": response, "error": error}
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+
+async def count_by_status(notion: AsyncNotionBatch, db_name: str, db_id: str) -> Dict[str, Any]:
+    """Conta os cards de uma database por status e mede o tempo gasto."""
+    started = time.perf_counter()
+    total = 0
+    status_count: Dict[str, int] = {}
+    async for page in notion.iter_pages(db_id):
+        total += 1
+        status = notion.get_page_status(page) or "Sem status"
+        status_count[status] = status_count.get(status, 0) + 1
+
+    return {
+        "name": db_name,
+        "total": total,
+        "status_count": status_count,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+async def run_stats(args: argparse.Namespace) -> None:
+    """Estatísticas de todas as databases, buscadas no mesmo event loop."""
+    async with AsyncNotionBatch(
+        max_connections=args.max_connections, rate_limit=args.rate_limit
+    ) as notion:
+        metrics = RequestMetrics() if args.metrics else None
+        if metrics:
+            notion.add_hook(metrics)
+
+        databases = (
+            [args.database] if args.database != "all" else list(notion.database_ids.keys())
+        )
+        targets = [
+            (db_name, notion.get_database_id(db_name))
+            for db_name in databases
+            if notion.get_database_id(db_name)
+        ]
+        if not targets:
+            print(f"Database '{args.database}' não encontrada.")
+            return
+
+        started = time.perf_counter()
+        all_stats = await asyncio.gather(
+            *(count_by_status(notion, db_name, db_id) for db_name, db_id in targets)
+        )
+        elapsed = time.perf_counter() - started
+
+        print(f"\n{'='*60}")
+        print("ESTATÍSTICAS DO NOTION (async)")
+        print(f"{'='*60}\n")
+
+        for stats in all_stats:
+            print(f"📊 {stats['name'].upper()}: {stats['total']} cards ({stats['elapsed']:.2f}s)")
+            for status, count in sorted(stats["status_count"].items(), key=lambda x: -x[1]):
+                print(f"   - {status}: {count}")
+            print()
+
+        print(f"{'='*60}")
+        print(f"TOTAL GERAL: {sum(stats['total'] for stats in all_stats)} cards")
+        print(f"{'='*60}")
+        print(f"\n⏱️  {elapsed:.2f}s, {notion.request_count} requisições")
+        if notion.retry_count:
+            print(f"🔁 Retries: {notion.retry_count}")
+        if metrics:
+            print_metrics(metrics)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Estatísticas do Notion com cliente asyncio",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplos:
+  %(prog)s --database all
+  %(prog)s --database studies --max-connections 8
+  %(prog)s --database all --metrics
+        """,
+    )
+    parser.add_argument(
+        "--database",
+        default="all",
+        help="Nome da database (studies, work, personal, all)",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=10,
+        help="Máximo de conexões keep-alive simultâneas (default: 10)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=3.0,
+        help="Limite de requisições por segundo (default: 3.0, 0 desativa)",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Mostrar métricas das requisições ao final (latência por endpoint, bytes, status)",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(run_stats(args))
+    except (ValueError, NotionAPIError) as e:
+        print(f"❌ Erro: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,24 +8,38 @@ Realiza operações em lote no Notion usando a API diretamente ou via MCP.
 - Arquivar cards antigos
 - Reorganizar hierarquias
 - Mover cards entre databases
+- Exportar databases para análise offline (Parquet/Arrow/CSV)
 
 Uso:
     python core/scripts/notion/notion_batch.py --action list --database studies
     python core/scripts/notion/notion_batch.py --action update-status --database studies --status "Concluído" --filter "tag:hackathon"
     python core/scripts/notion/notion_batch.py --action archive --database personal --older-than 90
     python core/scripts/notion/notion_batch.py --action stats --database all
+    python core/scripts/notion/notion_batch.py --action move --database personal --target studies --filter "tag:estudos"
+    python core/scripts/notion/notion_batch.py --action export --database studies --output studies.parquet
 """
 
 import argparse
+import csv
+import hashlib
 import json
 import os
+import random
+import re
+import sqlite3
 import sys
+import threading
+import time
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sized, Tuple, Union
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("requests não encontrado. Instale com: pip install requests")
     sys.exit(1)
@@ -48,20 +62,536 @@ try:
 except ImportError:
     pass
 
+# Exportação colunar (opcional): sem pyarrow, a ação export grava CSV
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
 
-class NotionBatch:
-    """Cliente para operações batch no Notion."""
+CACHE_DIR = Path.home() / ".cache" / "cursor-multiagent"
 
-    BASE_URL = "https://api.notion.com/v1"
-    NOTION_VERSION = "2022-06-28"
+# Espelho local das databases (sobrescrever com NOTION_MIRROR_PATH ou --mirror-path)
+DEFAULT_MIRROR_PATH = CACHE_DIR / "notion-mirror.sqlite3"
+
+# Journals de atualizações em lote (retomada após interrupção)
+JOURNAL_DIR = CACHE_DIR / "journals"
+
+# Linhas acumuladas por lote antes de gravar no arquivo de export
+EXPORT_BATCH_SIZE = 10_000
+
+# Limites da API por requisição de criação/append de blocos
+BLOCKS_PER_REQUEST = 100
+MAX_BLOCKS_PER_REQUEST = 1000
+
+# Extensão de arquivo por formato de export
+EXPORT_FORMATS = {"parquet": ".parquet", "arrow": ".arrow", "csv": ".csv"}
+
+
+@dataclass
+class PageRecord:
+    """
+    Representação compacta de uma página (opt-in via `--compact`).
+
+    Guarda só os campos lidos pelos comandos, em vez do JSON completo
+    com todas as propriedades, rich text e objetos de usuário.
+    """
+
+    __slots__ = ("id", "database_id", "title", "status", "created_time", "last_edited_time")
+
+    id: str
+    database_id: Optional[str]
+    title: str
+    status: Optional[str]
+    created_time: Optional[str]
+    last_edited_time: Optional[str]
+
+
+# Página crua da API ou registro compacto
+Page = Union[Dict, PageRecord]
 
-    def __init__(self, token: Optional[str] = None):
+
+class NotionAPIError(RuntimeError):
+    """Falha definitiva (após retries) em uma chamada à API do Notion."""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker thread-safe para indisponibilidades da API.
+
+    Após `failure_threshold` falhas consecutivas (5xx ou erro de rede) o circuito
+    abre e as requisições são rejeitadas sem tocar a rede até o fim do `cooldown`.
+    Depois disso uma nova falha reabre o circuito imediatamente.
+    """
+
+    def __init__(self, failure_threshold: int = 5, cooldown: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.open_count = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Indica se uma requisição pode ser enviada."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return False
+
+            # Meio-aberto: libera tentativas, mas a próxima falha reabre
+            self.opened_at = None
+            self.failures = self.failure_threshold - 1
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold and self.opened_at is None:
+                self.opened_at = time.monotonic()
+                self.open_count += 1
+
+
+class TokenBucket:
+    """
+    Estado do token bucket compartilhado por `RateLimiter` e pelo
+    `AsyncRateLimiter` (notion_async.py); cada um só fornece o lock e a espera.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
         """
-        Inicializa o cliente Notion.
+        Args:
+            rate: Requisições por segundo (0 desativa o limite)
+            burst: Máximo de tokens acumulados (default: arredondamento de rate)
+        """
+        self.rate = rate
+        self.capacity = burst or max(int(rate), 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+    def _take(self) -> float:
+        """
+        Tenta consumir um token (chamar com o lock).
+
+        Returns:
+            0 se o token foi consumido, senão quanto esperar antes de tentar de novo
+        """
+        now = time.monotonic()
+        # A pausa de um 429 vale mesmo com o limite desativado
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.rate <= 0:
+            return 0.0
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def _block(self, seconds: float) -> None:
+        """Suspende a emissão de tokens (chamar com o lock)."""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+
+
+class RateLimiter(TokenBucket):
+    """Token bucket thread-safe para respeitar o limite de requisições do Notion."""
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        super().__init__(rate, burst)
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Bloqueia até haver um token disponível (ou até o fim de uma pausa)."""
+        while True:
+            with self._lock:
+                wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Suspende todas as requisições (ex: Retry-After de um 429)."""
+        with self._lock:
+            self._block(seconds)
+
+
+class RequestMetrics:
+    """
+    Hook de instrumentação para `NotionBatch.add_hook`.
+
+    Agrega, por endpoint (IDs normalizados para `{id}`): requisições,
+    retries, erros, bytes enviados/recebidos, histograma de latência,
+    tempo esperando o rate limiter/Retry-After e tempo de decode do JSON.
+    """
+
+    # Limites superiores (ms) dos buckets do histograma de latência
+    LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    ID_PATTERN = re.compile(
+        r"\b(?:[0-9A-Za-z]{8}(?:-[0-9A-Za-z]{4}){3}-[0-9A-Za-z]{12}|[0-9a-f]{32})\b"
+    )
+
+    def __init__(self):
+        self.endpoints: Dict[str, Dict[str, Any]] = {}
+        self.status_counts: Dict[str, int] = {}
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def endpoint_key(cls, method: str, endpoint: str) -> str:
+        """`PATCH pages/<uuid>?x=1` → `PATCH pages/{id}`."""
+        return f"{method} {cls.ID_PATTERN.sub('{id}', endpoint.split('?', 1)[0])}"
+
+    def __call__(self, event: Dict[str, Any]) -> None:
+        key = self.endpoint_key(event["method"], event["endpoint"])
+        status = str(event.get("status") or event.get("error") or "erro")
+        latency_ms = event.get("elapsed", 0.0) * 1000
+
+        with self._lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = {
+                    "requests": 0,
+                    "retries": 0,
+                    "errors": 0,
+                    "bytes_sent": 0,
+                    "bytes_received": 0,
+                    "latency_sum_ms": 0.0,
+                    "latency_max_ms": 0.0,
+                    "histogram": [0] * (len(self.LATENCY_BUCKETS_MS) + 1),
+                    "throttle_wait_s": 0.0,
+                    "retry_delay_s": 0.0,
+                    "decode_s": 0.0,
+                }
+            stats["requests"] += 1
+            stats["retries"] += 1 if event.get("attempt") else 0
+            stats["errors"] += 0 if event.get("ok") else 1
+            stats["bytes_sent"] += event.get("bytes_sent", 0)
+            stats["bytes_received"] += event.get("bytes_received", 0)
+            stats["latency_sum_ms"] += latency_ms
+            stats["latency_max_ms"] = max(stats["latency_max_ms"], latency_ms)
+            stats["histogram"][bisect_left(self.LATENCY_BUCKETS_MS, latency_ms)] += 1
+            stats["throttle_wait_s"] += event.get("throttle_wait", 0.0)
+            stats["retry_delay_s"] += event.get("retry_delay", 0.0)
+            stats["decode_s"] += event.get("decode_time", 0.0)
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def percentile(self, histogram: List[int], fraction: float) -> Optional[float]:
+        """Percentil aproximado pelo limite superior do bucket (None se acima do último)."""
+        target = sum(histogram) * fraction
+        seen = 0
+        for index, count in enumerate(histogram):
+            seen += count
+            if count and seen >= target:
+                if index == len(self.LATENCY_BUCKETS_MS):
+                    return None
+                return float(self.LATENCY_BUCKETS_MS[index])
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Snapshot serializável em JSON (totais, status e detalhes por endpoint)."""
+        labels = [f"<={bucket}" for bucket in self.LATENCY_BUCKETS_MS] + ["+inf"]
+        with self._lock:
+            endpoints = {}
+            for key, stats in sorted(self.endpoints.items()):
+                endpoints[key] = {
+                    name: value for name, value in stats.items() if name != "histogram"
+                }
+                for name, fraction in (("latency_p50_ms", 0.5), ("latency_p95_ms", 0.95)):
+                    bound = self.percentile(stats["histogram"], fraction)
+                    # Limite do bucket nunca acima da maior latência observada
+                    endpoints[key][name] = min(bound, stats["latency_max_ms"]) if bound else None
+                endpoints[key]["latency_histogram_ms"] = dict(zip(labels, stats["histogram"]))
+            status_counts = dict(sorted(self.status_counts.items()))
+
+        totals = {
+            name: sum(stats[name] for stats in endpoints.values())
+            for name in (
+                "requests",
+                "retries",
+                "errors",
+                "bytes_sent",
+                "bytes_received",
+                "throttle_wait_s",
+                "retry_delay_s",
+                "decode_s",
+            )
+        }
+        totals["network_s"] = sum(stats["latency_sum_ms"] for stats in endpoints.values()) / 1000
+        return {
+            "wall_time_s": time.perf_counter() - self.started,
+            "totals": totals,
+            "status_counts": status_counts,
+            "endpoints": endpoints,
+        }
+
+
+class UpdateJournal:
+    """
+    Journal local das páginas já atualizadas (um ID por linha).
+
+    Cada sucesso é gravado imediatamente; uma execução interrompida
+    retoma sem reenviar os itens concluídos.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.done = set()
+        if path.exists():
+            self.done = {line.strip() for line in path.read_text().splitlines() if line.strip()}
+        self._file = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_operation(cls, *key_parts: str) -> "UpdateJournal":
+        """Journal em JOURNAL_DIR identificado pela operação (database, valor, filtro)."""
+        digest = hashlib.sha1("\0".join(key_parts).encode()).hexdigest()[:16]
+        return cls(JOURNAL_DIR / f"update-{digest}.log")
+
+    def __contains__(self, page_id: str) -> bool:
+        return page_id in self.done
+
+    def record(self, page_id: str) -> None:
+        """Marca uma página como concluída (thread-safe)."""
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a")
+            self._file.write(f"{page_id}\n")
+            self._file.flush()
+            self.done.add(page_id)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """Remove o journal (execução concluída sem falhas)."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+class NotionMirror:
+    """
+    Espelho local (SQLite) das databases do Notion.
+
+    Páginas são indexadas pelo ID. Após a primeira sincronização completa,
+    apenas páginas com `last_edited_time` >= watermark são baixadas.
+    A consulta incremental não retorna páginas arquivadas: as mutações do
+    `NotionBatch` atualizam o arquivo sempre que ele existe (mesmo sem
+    `--mirror`), mas páginas arquivadas/excluídas por outros clientes
+    (app do Notion, outras integrações) só saem com `--full-sync`.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS pages (
+            id TEXT PRIMARY KEY,
+            database_id TEXT NOT NULL,
+            last_edited_time TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_pages_database ON pages (database_id);
+        CREATE TABLE IF NOT EXISTS sync_state (
+            database_id TEXT PRIMARY KEY,
+            watermark TEXT,
+            synced_at TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, path: Path = DEFAULT_MIRROR_PATH):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.executescript(self.SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def get_watermark(self, database_id: str) -> Optional[str]:
+        """Retorna o maior `last_edited_time` já sincronizado da database."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT watermark FROM sync_state WHERE database_id = ?", (database_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def sync(self, notion: "NotionBatch", database_id: str, full: bool = False) -> int:
+        """
+        Sincroniza a database com o Notion.
 
         Args:
-            token: Notion API token. Se não fornecido, usa NOTION_API_KEY do ambiente.
+            notion: Cliente usado para consultar a API
+            database_id: ID da database
+            full: Rebaixar a database inteira (remove páginas que sumiram)
+
+        Returns:
+            Número de páginas baixadas
         """
+        watermark = None if full else self.get_watermark(database_id)
+        filter_obj = None
+        if watermark:
+            # on_or_after: timestamps do Notion têm precisão de minutos
+            filter_obj = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {"on_or_after": watermark},
+            }
+        # Ordem crescente: se a consulta for interrompida, o watermark continua válido
+        sorts = [{"timestamp": "last_edited_time", "direction": "ascending"}]
+        pages = notion.query_database(database_id, filter_obj=filter_obj, sorts=sorts)
+
+        with self._lock, self.conn:
+            if full:
+                self.conn.execute("DELETE FROM pages WHERE database_id = ?", (database_id,))
+            self._upsert(database_id, pages)
+
+            edited = [page["last_edited_time"] for page in pages if page.get("last_edited_time")]
+            new_watermark = max(edited + ([watermark] if watermark else []), default=None)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sync_state (database_id, watermark, synced_at) "
+                "VALUES (?, ?, ?)",
+                (database_id, new_watermark, datetime.now().isoformat()),
+            )
+
+        return len(pages)
+
+    def _upsert(self, database_id: str, pages: List[Dict]) -> None:
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO pages (id, database_id, last_edited_time, data) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (page["id"], database_id, page.get("last_edited_time"), json.dumps(page))
+                for page in pages
+            ],
+        )
+
+    def pages(self, database_id: str) -> Iterator[Dict]:
+        """Lê as páginas espelhadas de uma database (mais recentes primeiro)."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT data FROM pages WHERE database_id = ? ORDER BY last_edited_time DESC",
+                (database_id,),
+            ).fetchall()
+        # JSON decodificado sob demanda: só a página corrente vira dict
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def update(self, page: Dict) -> None:
+        """Atualiza uma página já espelhada com a resposta de um PATCH."""
+        with self._lock, self.conn:
+            self.conn.execute(
+                "UPDATE pages SET last_edited_time = ?, data = ? WHERE id = ?",
+                (page.get("last_edited_time"), json.dumps(page), page["id"]),
+            )
+
+    def remove(self, page_id: str) -> None:
+        """Remove uma página do espelho (ex: após arquivar)."""
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM pages WHERE id = ?", (page_id,))
+
+
+class TableExporter:
+    """
+    Grava linhas achatadas em Parquet, Arrow (IPC) ou CSV, em lotes.
+
+    Só `EXPORT_BATCH_SIZE` linhas ficam em memória: cada lote vira um
+    row group (Parquet) ou record batch (Arrow) assim que completa.
+    Colunas `timestamp` são convertidas para datetime UTC; `number` e
+    `boolean` mantêm o tipo; o resto é texto.
+    """
+
+    def __init__(self, path: Path, fmt: str, columns: List[Tuple[str, str]]):
+        if fmt != "csv" and pa is None:
+            raise ValueError("pyarrow não encontrado. Instale com: pip install pyarrow")
+
+        self.path = path
+        self.fmt = fmt
+        self.columns = columns
+        self.row_count = 0
+        self._batch: List[List[Any]] = []
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if fmt == "csv":
+            self._file = open(path, "w", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow([name for name, _ in columns])
+            return
+
+        arrow_types = {
+            "timestamp": pa.timestamp("ms", tz="UTC"),
+            "number": pa.float64(),
+            "boolean": pa.bool_(),
+        }
+        self._schema = pa.schema(
+            [(name, arrow_types.get(kind, pa.string())) for name, kind in columns]
+        )
+        if fmt == "parquet":
+            self._writer = pq.ParquetWriter(str(path), self._schema, compression="zstd")
+        else:
+            self._writer = pa_ipc.new_file(str(path), self._schema)
+
+    def write(self, row: List[Any]) -> None:
+        """Adiciona uma linha (na ordem de `columns`)."""
+        self.row_count += 1
+        if self.fmt == "csv":
+            self._writer.writerow(row)
+            return
+
+        self._batch.append(row)
+        if len(self._batch) >= EXPORT_BATCH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._batch:
+            return
+        arrays = []
+        for index, (_, kind) in enumerate(self.columns):
+            values = [row[index] for row in self._batch]
+            if kind == "timestamp":
+                values = [
+                    datetime.fromisoformat(value.replace("Z", "+00:00")) if value else None
+                    for value in values
+                ]
+            arrays.append(pa.array(values, type=self._schema.field(index).type))
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self._schema))
+        self._batch = []
+
+    def close(self) -> None:
+        if self.fmt == "csv":
+            self._file.close()
+            return
+        self._flush()
+        self._writer.close()
+
+
+class NotionClientMixin:
+    """
+    Partes do cliente que não fazem I/O de rede, compartilhadas por
+    `NotionBatch` e pelo `AsyncNotionBatch` (notion_async.py): token e
+    headers, IDs das databases, cache de schema, extratores de página e
+    hooks de instrumentação.
+    """
+
+    BASE_URL = "https://api.notion.com/v1"
+    NOTION_VERSION = "2022-06-28"
+    SUPPORTED_METHODS = ("GET", "POST", "PATCH")
+    RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 30.0
+
+    def _setup_client(self, token: Optional[str], base_url: Optional[str]) -> None:
+        """Inicializa token, headers, URL base, cache de schema e IDs das databases."""
         self.token = token or os.getenv("NOTION_API_KEY") or os.getenv("NOTION_TOKEN")
         if not self.token:
             raise ValueError(
@@ -74,6 +604,14 @@ class NotionBatch:
             "Content-Type": "application/json",
             "Notion-Version": self.NOTION_VERSION,
         }
+        base_url = base_url or os.getenv("NOTION_API_BASE_URL") or self.BASE_URL
+        self.base_url = base_url.rstrip("/")
+        self.request_hooks: List[Callable[[Dict[str, Any]], None]] = []
+
+        # Schema por database (ID sem hífens): propriedades e papel → nome
+        self._properties: Dict[str, Dict] = {}
+        self._schemas: Dict[str, Dict[str, str]] = {}
+        self._schema_lock = threading.Lock()
 
         # Carregar IDs das databases
         self.database_ids = self._load_database_ids()
@@ -95,41 +633,469 @@ class NotionBatch:
 
         return {}
 
-    def _request(self, method: str, endpoint: str, data: Optional[Dict] = None) -> Dict:
-        """Faz uma requisição à API do Notion."""
-        url = f"{self.BASE_URL}/{endpoint}"
+    def get_database_id(self, name: str) -> Optional[str]:
+        """Obtém o ID de uma database pelo nome."""
+        return self.database_ids.get(name.lower())
 
-        try:
-            if method == "GET":
-                response = requests.get(url, headers=self.headers, timeout=30)
-            elif method == "POST":
-                response = requests.post(url, headers=self.headers, json=data, timeout=30)
-            elif method == "PATCH":
-                response = requests.patch(url, headers=self.headers, json=data, timeout=30)
+    def add_hook(self, hook: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Registra um hook chamado após cada tentativa HTTP de `_request`.
+
+        O hook recebe um dict com `method`, `endpoint`, `attempt`, `ok`,
+        `status` ou `error`, `elapsed`, `bytes_sent`, `bytes_received`,
+        `throttle_wait`, `retry_delay` e `decode_time` (segundos), conforme
+        disponíveis. Pode ser chamado de várias threads (ex: `RequestMetrics`).
+        """
+        self.request_hooks.append(hook)
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        for hook in self.request_hooks:
+            hook(event)
+
+    def _is_idempotent(self, method: str, endpoint: str, idempotent: Optional[bool]) -> bool:
+        """
+        Valida o método e decide se a chamada pode ser repetida.
+
+        GET, PATCH e POST de consulta são idempotentes; criação (POST) não.
+        """
+        if method not in self.SUPPORTED_METHODS:
+            raise ValueError(f"Método não suportado: {method}")
+        if idempotent is None:
+            return method != "POST" or endpoint.endswith("/query")
+        return idempotent
+
+    def _record_status(self, status: int) -> None:
+        """Alimenta o circuit breaker: 5xx conta como falha, 429 não conta."""
+        if status not in self.RETRYABLE_STATUS:
+            self.circuit_breaker.record_success()
+        elif status != 429:
+            self.circuit_breaker.record_failure()
+
+    def _should_retry(self, status: Optional[int], idempotent: bool, last_attempt: bool) -> bool:
+        """
+        Decide se a tentativa deve ser repetida.
+
+        Args:
+            status: Status HTTP, ou None para erro de rede/timeout
+            idempotent: Se a chamada pode ser repetida sem efeito duplicado
+            last_attempt: Se já é a última tentativa permitida
+        """
+        if last_attempt:
+            return False
+        if status is None:
+            return idempotent
+        # 429 nunca foi processado: é seguro repetir mesmo sem idempotência
+        return status in self.RETRYABLE_STATUS and (status == 429 or idempotent)
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Atraso antes de um retry: Retry-After se presente, senão backoff com jitter."""
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                return 1.0
+        backoff = min(self.BACKOFF_MAX, self.BACKOFF_BASE * 2**attempt)
+        return backoff / 2 + random.uniform(0, backoff / 2)
+
+    def cached_properties(self, database_id: str) -> Optional[Dict]:
+        """Propriedades já cacheadas da database (None se ainda não buscadas)."""
+        with self._schema_lock:
+            return self._properties.get(database_id.replace("-", ""))
+
+    def register_properties(self, database_id: str, properties: Dict) -> None:
+        """Cacheia as propriedades da database e monta o mapa papel → propriedade."""
+        schema = {}
+        for role, prop_types in (("title", ("title",)), ("status", ("status", "select"))):
+            prop_name = self._find_property(properties, prop_types)
+            if prop_name:
+                schema[role] = prop_name
+
+        key = database_id.replace("-", "")
+        with self._schema_lock:
+            self._properties[key] = properties
+            self._schemas[key] = schema
+
+    def cached_schema(self, database_id: str) -> Dict[str, str]:
+        """Mapa papel → propriedade já cacheado (vazio se o schema não foi buscado)."""
+        with self._schema_lock:
+            return self._schemas.get(database_id.replace("-", ""), {})
+
+    def _page_property(self, page: Dict, role: str) -> Optional[Dict]:
+        """
+        Busca a propriedade de um papel via schema cacheado da database pai.
+
+        Returns:
+            A propriedade, ou None se o schema da database não estiver carregado
+        """
+        parent_id = page.get("parent", {}).get("database_id")
+        schema = self._schemas.get(parent_id.replace("-", "")) if parent_id else None
+        if not schema or role not in schema:
+            return None
+        return page.get("properties", {}).get(schema[role], {})
+
+    @staticmethod
+    def _find_property(properties: Dict, prop_types: Tuple[str, ...]) -> Optional[str]:
+        """Retorna o nome da primeira propriedade com um dos tipos informados."""
+        for prop_type in prop_types:
+            for name, prop in properties.items():
+                if prop.get("type") == prop_type:
+                    return name
+        return None
+
+    def to_record(self, page: Dict) -> PageRecord:
+        """Converte uma página crua em `PageRecord` (feito uma vez, na ingestão)."""
+        status = self.get_page_status(page)
+        return PageRecord(
+            id=page["id"],
+            database_id=page.get("parent", {}).get("database_id"),
+            title=self.get_page_title(page),
+            status=sys.intern(status) if status else None,
+            created_time=page.get("created_time"),
+            last_edited_time=page.get("last_edited_time"),
+        )
+
+    @staticmethod
+    def get_page_id(page: Page) -> str:
+        """Extrai o ID de uma página."""
+        return page.id if isinstance(page, PageRecord) else page["id"]
+
+    def get_page_title(self, page: Page) -> str:
+        """Extrai o título de uma página."""
+        if isinstance(page, PageRecord):
+            return page.title
+
+        prop = self._page_property(page, "title")
+        if prop is not None:
+            title_content = prop.get("title", [])
+            if title_content:
+                return title_content[0].get("plain_text", "Sem título")
+            return "Sem título"
+
+        # Sem schema: procurar propriedade de título
+        properties = page.get("properties", {})
+        for prop in properties.values():
+            if prop.get("type") == "title":
+                title_content = prop.get("title", [])
+                if title_content:
+                    return title_content[0].get("plain_text", "Sem título")
+
+        return "Sem título"
+
+    def get_page_status(self, page: Page) -> Optional[str]:
+        """Extrai o status de uma página."""
+        if isinstance(page, PageRecord):
+            return page.status
+
+        prop = self._page_property(page, "status")
+        if prop is not None:
+            option = prop.get(prop.get("type", "status"))
+            return option.get("name") if option else None
+
+        # Sem schema: procurar propriedade de status/select
+        properties = page.get("properties", {})
+        for prop in properties.values():
+            if prop.get("type") == "status":
+                status = prop.get("status")
+                if status:
+                    return status.get("name")
+            elif prop.get("type") == "select":
+                select = prop.get("select")
+                if select:
+                    return select.get("name")
+
+        return None
+
+    def get_page_date(self, page: Page, date_prop: str = "created_time") -> Optional[datetime]:
+        """Extrai uma data de uma página."""
+        if isinstance(page, PageRecord):
+            timestamps = ("created_time", "last_edited_time")
+            date_str = getattr(page, date_prop) if date_prop in timestamps else None
+        elif date_prop == "created_time":
+            date_str = page.get("created_time")
+        elif date_prop == "last_edited_time":
+            date_str = page.get("last_edited_time")
+        else:
+            properties = page.get("properties", {})
+            date_obj = properties.get(date_prop, {})
+            if date_obj.get("type") == "date" and date_obj.get("date"):
+                date_str = date_obj["date"].get("start")
             else:
-                raise ValueError(f"Método não suportado: {method}")
+                return None
 
-            response.raise_for_status()
-            return response.json()
+        if date_str:
+            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        return None
+
+
+class NotionBatch(NotionClientMixin):
+    """Cliente para operações batch no Notion."""
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        pool_size: int = 10,
+        timeout: int = 30,
+        rate_limit: float = 3.0,
+        mirror: Optional[NotionMirror] = None,
+        max_retries: int = 5,
+        base_url: Optional[str] = None,
+        mirror_path: Optional[Path] = None,
+    ):
+        """
+        Inicializa o cliente Notion.
+
+        Args:
+            token: Notion API token. Se não fornecido, usa NOTION_API_KEY do ambiente.
+            pool_size: Máximo de conexões keep-alive mantidas no pool HTTP
+            timeout: Timeout (segundos) de cada requisição
+            rate_limit: Requisições por segundo (Notion permite ~3 req/s)
+            mirror: Espelho local; se informado, `get_pages` lê dele
+            max_retries: Tentativas extras para 429, 5xx e erros de rede
+            base_url: URL da API (default: NOTION_API_BASE_URL ou BASE_URL);
+                útil para apontar para o servidor fake local
+            mirror_path: Espelho a manter em dia nas mutações quando `mirror`
+                não é informado (só se o arquivo já existir)
+        """
+        self._setup_client(token, base_url)
+        self.timeout = timeout
+
+        # Sessão compartilhada: reaproveita conexões TCP/TLS entre requisições
+        self.session = self._create_session(pool_size)
+        self.rate_limiter = RateLimiter(rate_limit)
+        self.circuit_breaker = CircuitBreaker()
+        self.max_retries = max_retries
+        self.retry_count = 0
+        self.mirror = mirror
+        self.mirror_path = mirror.path if mirror else mirror_path
+        self._mirror_writer = mirror
+        self.request_count = 0
+        self._lock = threading.Lock()
+
+    def _create_session(self, pool_size: int) -> requests.Session:
+        """Cria a sessão HTTP com pool de conexões keep-alive."""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Fecha a sessão HTTP e libera as conexões do pool."""
+        self.session.close()
+        if self._mirror_writer:
+            self._mirror_writer.close()
+
+    def __enter__(self) -> "NotionBatch":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def connection_stats(self) -> Dict[str, int]:
+        """
+        Retorna contadores de uso do pool de conexões.
+
+        Returns:
+            Dict com total de requisições, conexões abertas e conexões reutilizadas
+        """
+        opened = 0
+        adapter = self.session.get_adapter(self.base_url)
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            opened += getattr(pool, "num_connections", 0)
+
+        return {
+            "requests": self.request_count,
+            "connections": opened,
+            "reused": max(self.request_count - opened, 0),
+        }
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict] = None,
+        idempotent: Optional[bool] = None,
+    ) -> Dict:
+        """
+        Faz uma requisição à API do Notion.
+
+        Chamadas idempotentes (GET, PATCH e POST de consulta) são repetidas com
+        backoff exponencial + jitter em 5xx e erros de rede. 429 é sempre repetido,
+        respeitando `Retry-After`. Falhas consecutivas abrem o circuit breaker.
+
+        Args:
+            method: GET, POST ou PATCH
+            endpoint: Caminho relativo a `base_url`
+            data: Corpo JSON
+            idempotent: Força o tratamento de idempotência (default: pelo método)
+
+        Returns:
+            JSON da resposta, ou {} em caso de falha
+        """
+        url = f"{self.base_url}/{endpoint}"
+        idempotent = self._is_idempotent(method, endpoint, idempotent)
+
+        try:
+            for attempt in range(self.max_retries + 1):
+                last_attempt = attempt == self.max_retries
+                if not self.circuit_breaker.allow():
+                    print(f"Erro na requisição: circuit breaker aberto ({method} {endpoint})")
+                    return {}
+
+                waited = time.perf_counter()
+                self.rate_limiter.acquire()
+                with self._lock:
+                    self.request_count += 1
+
+                # Evento da tentativa, entregue aos hooks mesmo em retry/erro
+                event: Dict[str, Any] = {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "attempt": attempt,
+                    "ok": False,
+                    "throttle_wait": time.perf_counter() - waited,
+                }
+                started = time.perf_counter()
+                try:
+                    try:
+                        response = self.session.request(
+                            method, url, json=data, timeout=self.timeout
+                        )
+                    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                        event["elapsed"] = time.perf_counter() - started
+                        event["error"] = type(e).__name__
+                        self.circuit_breaker.record_failure()
+                        if not self._should_retry(None, idempotent, last_attempt):
+                            raise
+                        event["retry_delay"] = self._wait_retry(attempt)
+                        continue
+
+                    status = response.status_code
+                    event["elapsed"] = time.perf_counter() - started
+                    event["status"] = status
+                    event["bytes_sent"] = len(response.request.body or b"")
+                    event["bytes_received"] = len(response.content)
+                    self._record_status(status)
+                    if self._should_retry(status, idempotent, last_attempt):
+                        event["retry_delay"] = self._wait_retry(attempt, response)
+                        continue
+
+                    response.raise_for_status()
+                    decode_started = time.perf_counter()
+                    result = response.json()
+                    event["decode_time"] = time.perf_counter() - decode_started
+                    event["ok"] = True
+                    return result
+                finally:
+                    self._emit(event)
+            return {}
         except requests.exceptions.RequestException as e:
             print(f"Erro na requisição: {e}")
             if hasattr(e, 'response') and e.response is not None:
                 print(f"Resposta: {e.response.text}")
             return {}
 
-    def get_database_id(self, name: str) -> Optional[str]:
-        """Obtém o ID de uma database pelo nome."""
-        return self.database_ids.get(name.lower())
+    def _wait_retry(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        """
+        Aguarda antes de um retry: Retry-After se presente, senão backoff com jitter.
 
-    def query_database(
+        Returns:
+            Tempo dormido nesta thread (em 429 o atraso vira pausa do rate limiter
+            e é medido como espera na próxima tentativa)
+        """
+        with self._lock:
+            self.retry_count += 1
+
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        delay = self._retry_delay(attempt, retry_after)
+
+        if response is not None and response.status_code == 429:
+            # Limite global: pausa todas as threads, não só a atual
+            self.rate_limiter.pause(delay)
+            return 0.0
+        time.sleep(delay)
+        return delay
+
+    def run_bulk(
+        self,
+        items: Iterable[Any],
+        operation: Callable[[Any], Dict],
+        workers: int = 4,
+    ) -> List[Dict[str, Any]]:
+        """
+        Executa uma mutação em lote com concorrência limitada.
+
+        O limite de taxa é aplicado em `_request`, então os workers
+        compartilham o mesmo token bucket. `items` pode ser um gerador
+        (ex: `iter_pages`): o processamento começa enquanto os próximos
+        itens ainda estão sendo baixados.
+
+        Args:
+            items: Itens a processar (ex: páginas)
+            operation: Função chamada para cada item; resposta vazia indica falha
+            workers: Número máximo de requisições simultâneas
+
+        Returns:
+            Lista de resultados na mesma ordem de `items`
+            (`item`, `ok`, `response`, `error`)
+        """
+        workers = max(workers, 1)
+        total = len(items) if isinstance(items, Sized) else None
+        results: Dict[int, Dict[str, Any]] = {}
+        pending: Dict[Future, Tuple[int, Any]] = {}
+
+        def collect(futures: Iterable[Future]) -> None:
+            for future in futures:
+                index, item = pending.pop(future)
+                error = None
+                try:
+                    response = future.result()
+                    if not response:
+                        error = "requisição falhou"
+                except Exception as e:
+                    response = {}
+                    error = str(e)
+
+                results[index] = {
+                    "item": item,
+                    "ok": error is None,
+                    "response": response,
+                    "error": error,
+                }
+            progress = f"{len(results)}/{total}" if total is not None else str(len(results))
+            print(f"\r⏳ {progress}", end="", flush=True)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for index, item in enumerate(items):
+                pending[executor.submit(operation, item)] = (index, item)
+                # Backpressure: não acumular mais que 2x workers em espera
+                if len(pending) >= workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+            if pending:
+                done, _ = wait(pending)
+                collect(done)
+
+        if results:
+            print()
+        return [results[index] for index in range(len(results))]
+
+    def iter_database(
         self,
         database_id: str,
         filter_obj: Optional[Dict] = None,
         sorts: Optional[List[Dict]] = None,
         page_size: int = 100,
-    ) -> List[Dict]:
+    ) -> Iterator[Dict]:
         """
-        Consulta uma database do Notion.
+        Consulta uma database do Notion, produzindo as páginas conforme chegam.
+
+        Cada lote (`page_size` itens) é liberado assim que a resposta chega,
+        sem esperar o último cursor.
 
         Args:
             database_id: ID da database
@@ -137,8 +1103,8 @@ class NotionBatch:
             sorts: Ordenação
             page_size: Tamanho da página
 
-        Returns:
-            Lista de páginas/cards
+        Yields:
+            Páginas/cards
         """
         data = {"page_size": page_size}
         if filter_obj:
@@ -146,7 +1112,6 @@ class NotionBatch:
         if sorts:
             data["sorts"] = sorts
 
-        all_results = []
         has_more = True
         start_cursor = None
 
@@ -156,14 +1121,211 @@ class NotionBatch:
 
             response = self._request("POST", f"databases/{database_id}/query", data)
 
+            # Não tratar falha como fim dos dados: resultados ficariam truncados
             if not response:
-                break
+                raise NotionAPIError(f"Consulta à database {database_id} falhou após retries")
 
-            all_results.extend(response.get("results", []))
+            yield from response.get("results", [])
             has_more = response.get("has_more", False)
             start_cursor = response.get("next_cursor")
 
-        return all_results
+    def query_database(
+        self,
+        database_id: str,
+        filter_obj: Optional[Dict] = None,
+        sorts: Optional[List[Dict]] = None,
+        page_size: int = 100,
+    ) -> List[Dict]:
+        """
+        Consulta uma database do Notion.
+
+        Args:
+            database_id: ID da database
+            filter_obj: Filtro Notion
+            sorts: Ordenação
+            page_size: Tamanho da página
+
+        Returns:
+            Lista de páginas/cards
+        """
+        return list(self.iter_database(database_id, filter_obj, sorts, page_size))
+
+    def get_pages(
+        self,
+        database_id: str,
+        full_sync: bool = False,
+        filter_obj: Optional[Dict] = None,
+    ) -> List[Dict]:
+        """
+        Obtém todas as páginas de uma database.
+
+        Com espelho local, sincroniza apenas o que mudou e lê do SQLite;
+        sem espelho, consulta a database na API.
+
+        Args:
+            database_id: ID da database
+            full_sync: Forçar sincronização completa do espelho
+            filter_obj: Filtro Notion enviado à API. Ignorado com espelho:
+                o chamador deve aplicar o mesmo critério localmente.
+
+        Returns:
+            Lista de páginas/cards
+        """
+        return list(self.iter_pages(database_id, full_sync, filter_obj))
+
+    def iter_pages(
+        self,
+        database_id: str,
+        full_sync: bool = False,
+        filter_obj: Optional[Dict] = None,
+    ) -> Iterator[Dict]:
+        """
+        Versão em streaming de `get_pages`.
+
+        Sem espelho, as páginas são produzidas à medida que cada lote chega da API.
+        """
+        # Carrega o schema uma vez para que os extratores sejam lookups diretos
+        self.get_schema(database_id)
+
+        if not self.mirror:
+            yield from self.iter_database(database_id, filter_obj=filter_obj)
+            return
+
+        self.mirror.sync(self, database_id, full=full_sync)
+        yield from self.mirror.pages(database_id)
+
+    def retrieve_database(self, database_id: str) -> Dict:
+        """Obtém o objeto da database (inclui o schema das propriedades)."""
+        return self._request("GET", f"databases/{database_id}")
+
+    def get_properties(self, database_id: str) -> Dict:
+        """Retorna as propriedades da database (buscadas uma vez e cacheadas)."""
+        cached = self.cached_properties(database_id)
+        if cached is not None:
+            return cached
+
+        properties = self.retrieve_database(database_id).get("properties", {})
+        self.register_properties(database_id, properties)
+        return properties
+
+    def get_schema(self, database_id: str) -> Dict[str, str]:
+        """
+        Mapeia cada papel (`title`, `status`) para o nome da propriedade na database.
+
+        Returns:
+            Dict papel → nome da propriedade (vazio se o schema não pôde ser obtido)
+        """
+        self.get_properties(database_id)
+        return self.cached_schema(database_id)
+
+    def build_filter(self, database_id: str, key: str, value: str) -> Optional[Dict]:
+        """
+        Compila um filtro `key:value` da CLI em um filtro da API do Notion.
+
+        - `title:x` → `title.contains`
+        - `status:x` → `status/select.equals` para cada opção que contém `x`
+        - `<propriedade>:x` → conforme o tipo (multi_select/select/status/rich_text)
+
+        Args:
+            database_id: ID da database
+            key: Nome lógico (title, status) ou nome da propriedade
+            value: Valor procurado
+
+        Returns:
+            Filtro Notion, ou None se não for possível compilar
+            (nesse caso o filtro é aplicado só no cliente)
+        """
+        properties = self.get_properties(database_id)
+        if not properties:
+            return None
+
+        if key == "title":
+            prop_name = self._find_property(properties, ("title",))
+            if prop_name:
+                return {"property": prop_name, "title": {"contains": value}}
+            return None
+
+        if key == "status":
+            prop_name = self._find_property(properties, ("status", "select"))
+        else:
+            prop_name = next(
+                (name for name in properties if name.lower() in (key.lower(), f"{key.lower()}s")),
+                None,
+            )
+        if not prop_name:
+            return None
+
+        prop_type = properties[prop_name].get("type")
+        if prop_type in ("status", "select", "multi_select"):
+            # Preserva a busca por substring da CLI: expande para as opções existentes
+            operator = "contains" if prop_type == "multi_select" else "equals"
+            options = properties[prop_name].get(prop_type, {}).get("options", [])
+            names = [
+                opt["name"] for opt in options if value.lower() in opt.get("name", "").lower()
+            ]
+            conditions = [
+                {"property": prop_name, prop_type: {operator: name}} for name in names or [value]
+            ]
+            return conditions[0] if len(conditions) == 1 else {"or": conditions}
+        if prop_type in ("rich_text", "title"):
+            return {"property": prop_name, prop_type: {"contains": value}}
+
+        return None
+
+    def page_matches(self, page: Dict, key: str, value: str) -> bool:
+        """Aplica localmente o critério de `build_filter` (substring, ignorando caixa)."""
+        value = value.lower()
+
+        if key == "title":
+            return value in self.get_page_title(page).lower()
+        if key == "status":
+            status = self.get_page_status(page)
+            return bool(status and value in status.lower())
+
+        for name, prop in page.get("properties", {}).items():
+            if name.lower() not in (key.lower(), f"{key.lower()}s"):
+                continue
+            prop_type = prop.get("type")
+            if prop_type == "multi_select":
+                options = prop.get("multi_select", [])
+                return any(value in opt.get("name", "").lower() for opt in options)
+            if prop_type in ("status", "select"):
+                option = prop.get(prop_type) or {}
+                return value in option.get("name", "").lower()
+            if prop_type in ("rich_text", "title"):
+                text = "".join(item.get("plain_text", "") for item in prop.get(prop_type, []))
+                return value in text.lower()
+
+        return False
+
+    def build_status_update(self, database_id: str, status: str) -> Optional[Dict]:
+        """
+        Monta o payload de `update_page` para mudar o status.
+
+        Returns:
+            Propriedades a enviar, ou None se a database não tem status/select
+        """
+        prop_name = self.get_schema(database_id).get("status")
+        if not prop_name:
+            return None
+
+        prop_type = self.get_properties(database_id)[prop_name].get("type", "status")
+        return {prop_name: {prop_type: {"name": status}}}
+
+    def mirror_for_writes(self) -> Optional[NotionMirror]:
+        """
+        Espelho que as mutações devem manter em dia.
+
+        O de `--mirror` ou, sem ele, o arquivo em `mirror_path` se existir
+        (aberto na primeira mutação): a sincronização incremental não vê
+        páginas arquivadas, então um `archive` sem `--mirror` deixaria o
+        espelho contando-as até um `--full-sync`.
+        """
+        if self._mirror_writer is None and self.mirror_path and self.mirror_path.exists():
+            with self._lock:
+                if self._mirror_writer is None:
+                    self._mirror_writer = NotionMirror(self.mirror_path)
+        return self._mirror_writer
 
     def update_page(self, page_id: str, properties: Dict) -> Dict:
         """
@@ -176,7 +1338,11 @@ class NotionBatch:
         Returns:
             Página atualizada
         """
-        return self._request("PATCH", f"pages/{page_id}", {"properties": properties})
+        page = self._request("PATCH", f"pages/{page_id}", {"properties": properties})
+        mirror = self.mirror_for_writes()
+        if page and mirror:
+            mirror.update(page)
+        return page
 
     def archive_page(self, page_id: str) -> Dict:
         """
@@ -188,54 +1354,334 @@ class NotionBatch:
         Returns:
             Página arquivada
         """
-        return self._request("PATCH", f"pages/{page_id}", {"archived": True})
+        page = self._request("PATCH", f"pages/{page_id}", {"archived": True})
+        mirror = self.mirror_for_writes()
+        if page and mirror:
+            mirror.remove(page_id)
+        return page
+
+    # Propriedades calculadas pelo Notion: não podem ser escritas ao criar a página
+    READONLY_PROPERTY_TYPES = (
+        "formula",
+        "rollup",
+        "created_time",
+        "created_by",
+        "last_edited_time",
+        "last_edited_by",
+        "unique_id",
+        "button",
+        "verification",
+    )
 
-    def get_page_title(self, page: Dict) -> str:
-        """Extrai o título de uma página."""
-        properties = page.get("properties", {})
+    # Blocos que a API não permite criar (ou que perderiam o conteúdo na cópia)
+    UNCOPYABLE_BLOCK_TYPES = (
+        "child_page",
+        "child_database",
+        "link_preview",
+        "synced_block",
+        "template",
+        "unsupported",
+    )
 
-        # Procurar propriedade de título
-        for prop in properties.values():
-            if prop.get("type") == "title":
-                title_content = prop.get("title", [])
-                if title_content:
-                    return title_content[0].get("plain_text", "Sem título")
+    def create_page(
+        self, database_id: str, properties: Dict, children: Optional[List[Dict]] = None
+    ) -> Dict:
+        """
+        Cria uma página em uma database (não repetida em 5xx: POST não é idempotente).
 
-        return "Sem título"
+        Args:
+            database_id: ID da database pai
+            properties: Propriedades no formato de escrita
+            children: Até 100 blocos de conteúdo
 
-    def get_page_status(self, page: Dict) -> Optional[str]:
-        """Extrai o status de uma página."""
-        properties = page.get("properties", {})
+        Returns:
+            Página criada
+        """
+        data: Dict[str, Any] = {"parent": {"database_id": database_id}, "properties": properties}
+        if children:
+            data["children"] = children
+        return self._request("POST", "pages", data)
 
-        for prop in properties.values():
-            if prop.get("type") == "status":
-                status = prop.get("status")
-                if status:
-                    return status.get("name")
-            elif prop.get("type") == "select":
-                select = prop.get("select")
-                if select:
-                    return select.get("name")
+    def iter_block_children(self, block_id: str, page_size: int = 100) -> Iterator[Dict]:
+        """
+        Lista os blocos filhos de uma página/bloco, paginando pelo cursor.
 
-        return None
+        Yields:
+            Blocos na ordem do documento
+        """
+        start_cursor = None
+        while True:
+            endpoint = f"blocks/{block_id}/children?page_size={page_size}"
+            if start_cursor:
+                endpoint += f"&start_cursor={start_cursor}"
 
-    def get_page_date(self, page: Dict, date_prop: str = "created_time") -> Optional[datetime]:
-        """Extrai uma data de uma página."""
-        if date_prop == "created_time":
-            date_str = page.get("created_time")
-        elif date_prop == "last_edited_time":
-            date_str = page.get("last_edited_time")
-        else:
-            properties = page.get("properties", {})
-            date_obj = properties.get(date_prop, {})
-            if date_obj.get("type") == "date" and date_obj.get("date"):
-                date_str = date_obj["date"].get("start")
+            response = self._request("GET", endpoint)
+            if not response:
+                raise NotionAPIError(f"Leitura dos blocos de {block_id} falhou após retries")
+
+            yield from response.get("results", [])
+            if not response.get("has_more"):
+                return
+            start_cursor = response.get("next_cursor")
+
+    def get_block_tree(self, block_id: str, depth: int = 3) -> List[Dict]:
+        """
+        Blocos filhos com os descendentes em `children`, até `depth` níveis.
+
+        Três níveis (bloco + dois de aninhamento, ex: colunas) é o máximo
+        que a API aceita em uma única criação; níveis mais profundos não são lidos.
+        """
+        blocks = list(self.iter_block_children(block_id))
+        if depth > 1:
+            for block in blocks:
+                copyable = block.get("type") not in self.UNCOPYABLE_BLOCK_TYPES
+                if block.get("has_children") and copyable:
+                    block["children"] = self.get_block_tree(block["id"], depth - 1)
+        return blocks
+
+    def append_block_children(self, block_id: str, children: List[Dict]) -> Dict:
+        """Adiciona blocos ao final de uma página/bloco (sem retry em 5xx: duplicaria)."""
+        return self._request(
+            "PATCH", f"blocks/{block_id}/children", {"children": children}, idempotent=False
+        )
+
+    @classmethod
+    def block_payload(cls, block: Dict) -> Optional[Dict]:
+        """
+        Converte um bloco lido em payload de criação.
+
+        Returns:
+            Bloco no formato de escrita, ou None se não puder ser copiado
+            (tipos não suportados e arquivos hospedados no Notion, cuja URL expira)
+        """
+        block_type = block.get("type")
+        content = block.get(block_type)
+        if block_type in cls.UNCOPYABLE_BLOCK_TYPES or not isinstance(content, dict):
+            return None
+        if content.get("type") == "file":
+            return None
+
+        content = dict(content)
+        for key in ("rich_text", "caption"):
+            if key in content:
+                content[key] = cls.rich_text_payload(content[key])
+
+        children = [
+            payload for payload in map(cls.block_payload, block.get("children", [])) if payload
+        ]
+        if children:
+            content["children"] = children
+        return {"object": "block", "type": block_type, block_type: content}
+
+    @staticmethod
+    def rich_text_payload(items: List[Dict]) -> List[Dict]:
+        """Rich text lido → formato de escrita (menções e equações viram texto simples)."""
+        payload = []
+        for item in items:
+            if item.get("type") == "text":
+                text = {"content": item["text"]["content"], "link": item["text"].get("link")}
             else:
-                return None
+                text = {"content": item.get("plain_text", ""), "link": None}
+            entry: Dict[str, Any] = {"type": "text", "text": text}
+            if item.get("annotations"):
+                entry["annotations"] = item["annotations"]
+            payload.append(entry)
+        return payload
+
+    def copy_properties(self, page: Dict, target_database_id: str) -> Dict:
+        """
+        Propriedades da página no formato de escrita para a database destino.
 
-        if date_str:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        return None
+        Copia as propriedades com mesmo nome e tipo no destino (o título sempre,
+        mesmo com outro nome). Propriedades calculadas e status sem opção
+        equivalente no destino são descartados.
+        """
+        target = self.get_properties(target_database_id)
+        target_title = self._find_property(target, ("title",))
+        properties: Dict[str, Any] = {}
+
+        for name, prop in page.get("properties", {}).items():
+            prop_type = prop.get("type")
+            if prop_type == "title":
+                name = target_title
+            if not name or target.get(name, {}).get("type") != prop_type:
+                continue
+            if prop_type in self.READONLY_PROPERTY_TYPES:
+                continue
+
+            value = prop.get(prop_type)
+            if prop_type in ("title", "rich_text"):
+                value = self.rich_text_payload(value or [])
+            elif prop_type in ("select", "status"):
+                if not value:
+                    continue
+                if prop_type == "status":
+                    options = target[name].get("status", {}).get("options", [])
+                    if value.get("name") not in {option.get("name") for option in options}:
+                        continue
+                value = {"name": value["name"]}
+            elif prop_type == "multi_select":
+                value = [{"name": option["name"]} for option in value or []]
+            elif prop_type in ("people", "relation"):
+                value = [{"id": item["id"]} for item in value or []]
+            elif prop_type == "files":
+                value = [item for item in value or [] if item.get("type") == "external"]
+            properties[name] = {prop_type: value}
+
+        return properties
+
+    @staticmethod
+    def chunk_blocks(blocks: List[Dict]) -> Iterator[List[Dict]]:
+        """Divide blocos em lotes de até 100 (topo) e 1000 (com aninhados) por requisição."""
+        chunk: List[Dict] = []
+        size = 0
+        for block in blocks:
+            children = block[block["type"]].get("children", [])
+            count = 1 + len(children) + sum(
+                len(child[child["type"]].get("children", [])) for child in children
+            )
+            full = len(chunk) >= BLOCKS_PER_REQUEST or size + count > MAX_BLOCKS_PER_REQUEST
+            if chunk and full:
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(block)
+            size += count
+        if chunk:
+            yield chunk
+
+    def copy_page(self, page: Dict, target_database_id: str) -> Dict:
+        """
+        Cria no destino uma cópia da página (propriedades + conteúdo).
+
+        Os blocos são lidos paginados e enviados na criação (primeiro lote)
+        e em appends sequenciais (demais lotes, preservando a ordem).
+
+        Returns:
+            Página criada, ou {} se a criação ou algum append falhar
+            (uma cópia parcial é arquivada para não deixar duplicatas)
+        """
+        blocks = [
+            payload
+            for payload in map(self.block_payload, self.get_block_tree(page["id"]))
+            if payload
+        ]
+        chunks = list(self.chunk_blocks(blocks))
+        properties = self.copy_properties(page, target_database_id)
+
+        created = self.create_page(target_database_id, properties, chunks[0] if chunks else None)
+        if not created:
+            return {}
+        for chunk in chunks[1:]:
+            if not self.append_block_children(created["id"], chunk):
+                self.archive_page(created["id"])
+                return {}
+        return created
+
+    def export_columns(self, database_id: str) -> List[Tuple[str, str, str]]:
+        """
+        Colunas de export da database: metadados da página + uma por propriedade.
+
+        Returns:
+            Lista de (coluna, origem, tipo da coluna). `origem` é o campo da
+            página (`id`, `url`, timestamps) ou `properties.<nome>`; o tipo é
+            `timestamp`, `number`, `boolean` ou `string`.
+        """
+        columns = [
+            ("id", "id", "string"),
+            ("url", "url", "string"),
+            ("created_time", "created_time", "timestamp"),
+            ("last_edited_time", "last_edited_time", "timestamp"),
+        ]
+        reserved = {name for name, _, _ in columns}
+
+        kinds = {"number": "number", "checkbox": "boolean"}
+        for name, prop in self.get_properties(database_id).items():
+            column = f"prop_{name}" if name in reserved else name
+            columns.append((column, f"properties.{name}", kinds.get(prop.get("type"), "string")))
+        return columns
+
+    def flatten_page(self, page: Dict, columns: List[Tuple[str, str, str]]) -> List[Any]:
+        """Achata uma página crua em uma linha, na ordem de `export_columns`."""
+        properties = page.get("properties", {})
+        row = []
+        for _, source, _ in columns:
+            if source.startswith("properties."):
+                row.append(self.flatten_property(properties.get(source[len("properties."):])))
+            else:
+                row.append(page.get(source))
+        return row
+
+    @classmethod
+    def flatten_property(cls, prop: Optional[Dict]) -> Any:
+        """
+        Reduz uma propriedade do Notion a um valor escalar.
+
+        Texto vira `plain_text` concatenado, opções viram o nome, listas
+        (multi_select, people, relation, files) viram nomes/IDs separados
+        por vírgula e datas viram o `start`.
+        """
+        if not prop:
+            return None
+
+        prop_type = prop.get("type")
+        value = prop.get(prop_type)
+        if value is None:
+            return None
+
+        if prop_type in ("title", "rich_text"):
+            return "".join(item.get("plain_text", "") for item in value)
+        if prop_type in ("select", "status"):
+            return value.get("name")
+        if prop_type == "multi_select":
+            return ", ".join(option.get("name", "") for option in value)
+        if prop_type == "date":
+            return value.get("start")
+        if prop_type == "people":
+            return ", ".join(person.get("name") or person.get("id", "") for person in value)
+        if prop_type == "relation":
+            return ", ".join(item.get("id", "") for item in value)
+        if prop_type == "files":
+            return ", ".join(item.get("name", "") for item in value)
+        if prop_type in ("created_by", "last_edited_by"):
+            return value.get("name") or value.get("id")
+        if prop_type == "unique_id":
+            prefix = value.get("prefix")
+            return f"{prefix}-{value.get('number')}" if prefix else str(value.get("number"))
+        if prop_type in ("formula", "rollup"):
+            inner = value.get(value.get("type"))
+            if isinstance(inner, dict):
+                return inner.get("start")
+            if isinstance(inner, list):
+                return ", ".join(str(cls.flatten_property(item)) for item in inner)
+            return None if inner is None else str(inner)
+        if prop_type == "checkbox":
+            return bool(value)
+        if prop_type == "number":
+            return float(value)
+        return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+
+
+def page_loader(notion: NotionBatch, args: argparse.Namespace) -> Callable[[Dict], Page]:
+    """Conversão feita na ingestão: `PageRecord` com --compact, página crua sem."""
+    return notion.to_record if args.compact else (lambda page: page)
+
+
+def parse_filter(
+    notion: NotionBatch, db_id: str, args: argparse.Namespace
+) -> Tuple[str, str, Optional[Dict]]:
+    """
+    Interpreta `--filter key:value` (sem `:`, filtra pelo título).
+
+    Returns:
+        Tuple de (key, value, filtro da API). O filtro da API é None sem
+        --filter ou com --mirror; o filtro local (`page_matches`) vale sempre
+    """
+    if not args.filter:
+        return "", "", None
+
+    key, value = args.filter.split(":", 1) if ":" in args.filter else ("title", args.filter)
+    filter_obj = None if notion.mirror else notion.build_filter(db_id, key, value)
+    return key, value, filter_obj
 
 
 def cmd_list(notion: NotionBatch, args: argparse.Namespace) -> None:
@@ -246,14 +1692,21 @@ def cmd_list(notion: NotionBatch, args: argparse.Namespace) -> None:
         print(f"Databases disponíveis: {list(notion.database_ids.keys())}")
         return
 
-    pages = notion.query_database(db_id)
+    # Streaming: conta o total sem manter a database inteira em memória
+    load = page_loader(notion, args)
+    total = 0
+    shown: List[Page] = []
+    for page in notion.iter_pages(db_id, full_sync=args.full_sync):
+        total += 1
+        if len(shown) < args.limit:
+            shown.append(load(page))
 
     print(f"\n{'='*60}")
     print(f"Database: {args.database.upper()}")
-    print(f"Total: {len(pages)} cards")
+    print(f"Total: {total} cards")
     print(f"{'='*60}\n")
 
-    for page in pages[:args.limit]:
+    for page in shown:
         title = notion.get_page_title(page)
         status = notion.get_page_status(page) or "N/A"
         created = notion.get_page_date(page, "created_time")
@@ -262,35 +1715,65 @@ def cmd_list(notion: NotionBatch, args: argparse.Namespace) -> None:
         print(f"- [{status}] {title} (criado: {created_str})")
 
 
+def collect_database_stats(
+    notion: NotionBatch, db_name: str, db_id: str, full_sync: bool = False
+) -> Dict[str, Any]:
+    """Conta os cards de uma database por status (em streaming) e mede o tempo gasto."""
+    started = time.perf_counter()
+    total = 0
+    status_count: Dict[str, int] = {}
+    for page in notion.iter_pages(db_id, full_sync=full_sync):
+        total += 1
+        status = notion.get_page_status(page) or "Sem status"
+        status_count[status] = status_count.get(status, 0) + 1
+
+    return {
+        "name": db_name,
+        "total": total,
+        "status_count": status_count,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
 def cmd_stats(notion: NotionBatch, args: argparse.Namespace) -> None:
     """Mostra estatísticas das databases."""
     databases = [args.database] if args.database != "all" else list(notion.database_ids.keys())
+    targets = [
+        (db_name, notion.get_database_id(db_name))
+        for db_name in databases
+        if notion.get_database_id(db_name)
+    ]
 
     print(f"\n{'='*60}")
     print("ESTATÍSTICAS DO NOTION")
     print(f"{'='*60}\n")
 
-    total_cards = 0
-
-    for db_name in databases:
-        db_id = notion.get_database_id(db_name)
-        if not db_id:
-            continue
-
-        pages = notion.query_database(db_id)
-        total_cards += len(pages)
-
-        # Contar por status
-        status_count: Dict[str, int] = {}
-        for page in pages:
-            status = notion.get_page_status(page) or "Sem status"
-            status_count[status] = status_count.get(status, 0) + 1
+    # Databases consultadas em paralelo; map preserva a ordem de exibição
+    started = time.perf_counter()
+    workers = max(min(args.workers, len(targets)), 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        all_stats = list(
+            executor.map(
+                lambda target: collect_database_stats(notion, *target, args.full_sync),
+                targets,
+            )
+        )
+    elapsed = time.perf_counter() - started
 
-        print(f"📊 {db_name.upper()}: {len(pages)} cards")
-        for status, count in sorted(status_count.items(), key=lambda x: -x[1]):
+    total_cards = 0
+    for stats in all_stats:
+        total_cards += stats["total"]
+        print(f"📊 {stats['name'].upper()}: {stats['total']} cards ({stats['elapsed']:.2f}s)")
+        for status, count in sorted(stats["status_count"].items(), key=lambda x: -x[1]):
             print(f"   - {status}: {count}")
         print()
 
+    if len(all_stats) > 1:
+        print(f"⏱️  Tempo por database ({workers} workers, {elapsed:.2f}s no total):")
+        for stats in sorted(all_stats, key=lambda x: -x["elapsed"]):
+            print(f"   - {stats['name']}: {stats['elapsed']:.2f}s, {stats['total']} cards")
+        print()
+
     print(f"{'='*60}")
     print(f"TOTAL GERAL: {total_cards} cards")
     print(f"{'='*60}")
@@ -304,46 +1787,72 @@ def cmd_archive(notion: NotionBatch, args: argparse.Namespace) -> None:
         return
 
     cutoff_date = datetime.now() - timedelta(days=args.older_than)
-    pages = notion.query_database(db_id)
 
-    to_archive = []
-    for page in pages:
+    def is_stale(page: Dict) -> bool:
         last_edited = notion.get_page_date(page, "last_edited_time")
-        if last_edited and last_edited.replace(tzinfo=None) < cutoff_date:
-            to_archive.append(page)
+        return bool(last_edited and last_edited.replace(tzinfo=None) < cutoff_date)
+
+    # Filtro enviado à API: só páginas antigas trafegam pela rede
+    date_filter = {
+        "timestamp": "last_edited_time",
+        "last_edited_time": {"before": cutoff_date.isoformat()},
+    }
+    load = page_loader(notion, args)
+    to_archive = (
+        load(page)
+        for page in notion.iter_pages(db_id, full_sync=args.full_sync, filter_obj=date_filter)
+        if is_stale(page)
+    )
 
     print(f"\n{'='*60}")
     print(f"ARQUIVAR CARDS > {args.older_than} dias")
     print(f"Database: {args.database}")
-    print(f"Cards a arquivar: {len(to_archive)}")
-    print(f"{'='*60}\n")
 
-    if not to_archive:
-        print("Nenhum card para arquivar.")
-        return
+    if args.dry_run:
+        preview = list(to_archive)
+        print(f"Cards a arquivar: {len(preview)}")
+        print(f"{'='*60}\n")
 
-    for page in to_archive[:10]:  # Mostrar primeiros 10
-        title = notion.get_page_title(page)
-        last_edited = notion.get_page_date(page, "last_edited_time")
-        last_edited_str = last_edited.strftime("%Y-%m-%d") if last_edited else "N/A"
-        print(f"- {title} (última edição: {last_edited_str})")
+        if not preview:
+            print("Nenhum card para arquivar.")
+            return
 
-    if len(to_archive) > 10:
-        print(f"... e mais {len(to_archive) - 10} cards")
+        for page in preview[:10]:  # Mostrar primeiros 10
+            title = notion.get_page_title(page)
+            last_edited = notion.get_page_date(page, "last_edited_time")
+            last_edited_str = last_edited.strftime("%Y-%m-%d") if last_edited else "N/A"
+            print(f"- {title} (última edição: {last_edited_str})")
+
+        if len(preview) > 10:
+            print(f"... e mais {len(preview) - 10} cards")
 
-    if args.dry_run:
         print("\n[DRY RUN] Nenhuma alteração feita.")
         return
 
-    print("\nArquivando...")
-    archived = 0
-    for page in to_archive:
-        result = notion.archive_page(page["id"])
-        if result:
-            archived += 1
-            print(f"✓ Arquivado: {notion.get_page_title(page)}")
+    print(f"{'='*60}\n")
 
-    print(f"\n✅ {archived} cards arquivados.")
+    # Arquiva enquanto os próximos lotes ainda estão sendo baixados
+    print(f"Arquivando ({args.workers} workers, {args.rate_limit} req/s)...")
+    results = notion.run_bulk(
+        to_archive, lambda page: notion.archive_page(notion.get_page_id(page)), workers=args.workers
+    )
+
+    if not results:
+        print("Nenhum card para arquivar.")
+        return
+
+    for result in results:
+        title = notion.get_page_title(result["item"])
+        if result["ok"]:
+            print(f"✓ Arquivado: {title}")
+        else:
+            print(f"✗ Falhou: {title} ({result['error']})")
+
+    archived = sum(1 for result in results if result["ok"])
+    print(f"\nCards a arquivar: {len(results)}")
+    print(f"✅ {archived} cards arquivados.")
+    if archived < len(results):
+        print(f"❌ {len(results) - archived} falhas.")
 
 
 def cmd_update_status(notion: NotionBatch, args: argparse.Namespace) -> None:
@@ -353,22 +1862,16 @@ def cmd_update_status(notion: NotionBatch, args: argparse.Namespace) -> None:
         print(f"Database '{args.database}' não encontrada.")
         return
 
-    pages = notion.query_database(db_id)
-
-    # Filtrar se especificado
-    if args.filter:
-        key, value = args.filter.split(":", 1) if ":" in args.filter else ("title", args.filter)
-        filtered = []
-        for page in pages:
-            if key == "title":
-                title = notion.get_page_title(page)
-                if value.lower() in title.lower():
-                    filtered.append(page)
-            elif key == "status":
-                status = notion.get_page_status(page)
-                if status and value.lower() in status.lower():
-                    filtered.append(page)
-        pages = filtered
+    # Filtrar se especificado (na API quando possível, e sempre no cliente)
+    key, value, filter_obj = parse_filter(notion, db_id, args)
+
+    # Filtro local aplicado antes da conversão: propriedades genéricas só existem na página crua
+    load = page_loader(notion, args)
+    pages = [
+        load(page)
+        for page in notion.iter_pages(db_id, full_sync=args.full_sync, filter_obj=filter_obj)
+        if not args.filter or notion.page_matches(page, key, value)
+    ]
 
     print(f"\n{'='*60}")
     print(f"ATUALIZAR STATUS para: {args.status}")
@@ -388,15 +1891,262 @@ def cmd_update_status(notion: NotionBatch, args: argparse.Namespace) -> None:
     if len(pages) > 10:
         print(f"... e mais {len(pages) - 10} cards")
 
+    properties = notion.build_status_update(db_id, args.status)
+    if not properties:
+        print("\n⚠️  Database sem propriedade de status/select para atualizar.")
+        return
+
+    journal = (
+        UpdateJournal(args.journal)
+        if args.journal
+        else UpdateJournal.for_operation(db_id, args.status, args.filter or "")
+    )
+    at_target = 0
+    pending: List[Page] = []
+    for page in pages:
+        if notion.get_page_status(page) == args.status:
+            at_target += 1
+        elif notion.get_page_id(page) not in journal:
+            pending.append(page)
+    resumed = len(pages) - at_target - len(pending)
+
+    print(f"\nJá no status alvo: {at_target}")
+    if resumed:
+        print(f"Já concluídos (journal {journal.path}): {resumed}")
+    print(f"A atualizar: {len(pending)}")
+
     if args.dry_run:
         print("\n[DRY RUN] Nenhuma alteração feita.")
         return
 
-    # A atualização real dependeria de saber o nome da propriedade de status
-    print("\n⚠️  Para atualizar status, configure a propriedade correta na database.")
+    if not pending:
+        journal.discard()
+        print("\n✅ Nada a atualizar.")
+        return
 
+    def update(page: Page) -> Dict:
+        page_id = notion.get_page_id(page)
+        response = notion.update_page(page_id, properties)
+        if response:
+            journal.record(page_id)
+        return response
 
-def main():
+    print(f"\nAtualizando ({args.workers} workers, {args.rate_limit} req/s)...")
+    try:
+        results = notion.run_bulk(pending, update, workers=args.workers)
+    finally:
+        journal.close()
+
+    failed = [result for result in results if not result["ok"]]
+    for result in failed:
+        print(f"✗ Falhou: {notion.get_page_title(result['item'])} ({result['error']})")
+
+    print(f"\n✅ {len(results) - len(failed)} cards atualizados para '{args.status}'.")
+    if failed:
+        print(f"❌ {len(failed)} falhas. Rode o mesmo comando para retomar ({journal.path}).")
+    else:
+        journal.discard()
+
+
+def cmd_move(notion: NotionBatch, args: argparse.Namespace) -> None:
+    """Move cards para outra database (cria a cópia no destino e arquiva a origem)."""
+    db_id = notion.get_database_id(args.database)
+    target_id = notion.get_database_id(args.target)
+    if not db_id or not target_id:
+        missing = args.database if not db_id else args.target
+        print(f"Database '{missing}' não encontrada.")
+        print(f"Databases disponíveis: {list(notion.database_ids.keys())}")
+        return
+    if db_id == target_id:
+        print("Origem e destino são a mesma database.")
+        return
+
+    key, value, filter_obj = parse_filter(notion, db_id, args)
+
+    to_move = (
+        page
+        for page in notion.iter_pages(db_id, full_sync=args.full_sync, filter_obj=filter_obj)
+        if not args.filter or notion.page_matches(page, key, value)
+    )
+
+    # Schema do destino buscado uma vez: os workers do run_bulk leem do cache
+    notion.get_properties(target_id)
+
+    print(f"\n{'='*60}")
+    print(f"MOVER CARDS: {args.database} → {args.target}")
+
+    if args.dry_run:
+        preview = list(to_move)
+        print(f"Cards a mover: {len(preview)}")
+        print(f"{'='*60}\n")
+
+        if not preview:
+            print("Nenhum card encontrado com o filtro especificado.")
+            return
+
+        for page in preview[:10]:
+            copied = notion.copy_properties(page, target_id)
+            # O título é copiado mesmo com outro nome no destino
+            title = next((name for name, value in copied.items() if "title" in value), None)
+            dropped = [
+                name
+                for name, prop in page.get("properties", {}).items()
+                if (title if prop.get("type") == "title" else name) not in copied
+            ]
+            note = f" (não copiadas: {', '.join(dropped)})" if dropped else ""
+            print(f"- {notion.get_page_title(page)}: {len(copied)} propriedades{note}")
+
+        if len(preview) > 10:
+            print(f"... e mais {len(preview) - 10} cards")
+
+        print("\n[DRY RUN] Nenhuma alteração feita.")
+        return
+
+    print(f"{'='*60}\n")
+
+    # Journal marca as páginas já copiadas: retomar só arquiva, sem criar duplicatas
+    journal = (
+        UpdateJournal(args.journal)
+        if args.journal
+        else UpdateJournal.for_operation("move", db_id, target_id, args.filter or "")
+    )
+
+    def move(page: Dict) -> Dict:
+        page_id = page["id"]
+        if page_id not in journal:
+            if not notion.copy_page(page, target_id):
+                return {}
+            journal.record(page_id)
+        return notion.archive_page(page_id)
+
+    print(f"Movendo ({args.workers} workers, {args.rate_limit} req/s)...")
+    try:
+        results = notion.run_bulk(to_move, move, workers=args.workers)
+    finally:
+        journal.close()
+
+    if not results:
+        print("Nenhum card encontrado com o filtro especificado.")
+        return
+
+    failed = [result for result in results if not result["ok"]]
+    for result in failed:
+        print(f"✗ Falhou: {notion.get_page_title(result['item'])} ({result['error']})")
+
+    print(f"\n✅ {len(results) - len(failed)} cards movidos para '{args.target}'.")
+    if failed:
+        print(f"❌ {len(failed)} falhas. Rode o mesmo comando para retomar ({journal.path}).")
+    else:
+        journal.discard()
+
+
+def cmd_export(notion: NotionBatch, args: argparse.Namespace) -> None:
+    """Exporta uma database para Parquet/Arrow/CSV com as propriedades achatadas."""
+    db_id = notion.get_database_id(args.database)
+    if not db_id:
+        print(f"Database '{args.database}' não encontrada.")
+        return
+
+    fmt = args.format
+    if fmt == "auto":
+        suffix = args.output.suffix.lower() if args.output else ""
+        fmt = next((name for name, ext in EXPORT_FORMATS.items() if ext == suffix), None)
+        fmt = fmt or ("parquet" if pa is not None else "csv")
+    output = args.output or Path(f"notion-{args.database}{EXPORT_FORMATS[fmt]}")
+
+    key, value, filter_obj = parse_filter(notion, db_id, args)
+
+    columns = notion.export_columns(db_id)
+    try:
+        exporter = TableExporter(output, fmt, [(name, kind) for name, _, kind in columns])
+    except ValueError as e:
+        print(f"❌ Erro: {e}")
+        return
+
+    # Streaming: só o lote corrente fica em memória, mesmo com 100k cards
+    started = time.perf_counter()
+    try:
+        for page in notion.iter_pages(db_id, full_sync=args.full_sync, filter_obj=filter_obj):
+            if args.filter and not notion.page_matches(page, key, value):
+                continue
+            exporter.write(notion.flatten_page(page, columns))
+    finally:
+        exporter.close()
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'='*60}")
+    print(f"EXPORT: {args.database.upper()}")
+    print(f"{'='*60}\n")
+    print(f"Arquivo: {output} ({fmt})")
+    print(f"Cards: {exporter.row_count}")
+    print(f"Colunas: {len(columns)} ({', '.join(name for name, _, _ in columns)})")
+    print(f"Tempo: {elapsed:.2f}s")
+
+
+def print_metrics(metrics: RequestMetrics) -> None:
+    """Mostra o resumo de `RequestMetrics` (onde o tempo foi gasto e por endpoint)."""
+    snapshot = metrics.to_dict()
+    totals = snapshot["totals"]
+    if not totals["requests"]:
+        return
+
+    print(f"\n{'='*78}")
+    print(f"MÉTRICAS ({snapshot['wall_time_s']:.2f}s de execução)")
+    print(f"{'='*78}")
+    print(
+        f"Rede: {totals['network_s']:.2f}s | Throttling: "
+        f"{totals['throttle_wait_s'] + totals['retry_delay_s']:.2f}s | "
+        f"Decode JSON: {totals['decode_s']:.2f}s | "
+        f"{totals['bytes_sent'] / 1024:.0f} KB enviados, "
+        f"{totals['bytes_received'] / 1024:.0f} KB recebidos"
+    )
+    print("(tempos somados entre threads; com --workers > 1 podem passar do tempo de execução)\n")
+
+    def ms(value: Optional[float]) -> str:
+        return f"{value:.0f}" if value is not None else "-"
+
+    print(f"{'Endpoint':<34} {'Req':>6} {'Retry':>6} {'Erro':>5} "
+          f"{'p50 ms':>7} {'p95 ms':>7} {'máx ms':>7}")
+    print("-" * 78)
+    for key, stats in snapshot["endpoints"].items():
+        print(
+            f"{key[:34]:<34} {stats['requests']:>6} {stats['retries']:>6} {stats['errors']:>5} "
+            f"{ms(stats['latency_p50_ms']):>7} {ms(stats['latency_p95_ms']):>7} "
+            f"{stats['latency_max_ms']:>7.0f}"
+        )
+
+    statuses = snapshot["status_counts"].items()
+    print(f"\nStatus: {', '.join(f'{status}: {count}' for status, count in statuses)}")
+
+
+def print_run_summary(notion: NotionBatch) -> None:
+    """Mostra o resumo de execução (uso do pool de conexões)."""
+    stats = notion.connection_stats()
+    if not stats["requests"]:
+        return
+
+    print(
+        f"\n🔌 Conexões: {stats['requests']} requisições, "
+        f"{stats['connections']} abertas, {stats['reused']} reutilizadas"
+    )
+    if notion.retry_count:
+        print(f"🔁 Retries: {notion.retry_count}")
+    if notion.circuit_breaker.open_count:
+        print(f"⚡ Circuit breaker aberto {notion.circuit_breaker.open_count}x")
+
+
+ACTIONS = {
+    "list": cmd_list,
+    "stats": cmd_stats,
+    "archive": cmd_archive,
+    "update-status": cmd_update_status,
+    "move": cmd_move,
+    "export": cmd_export,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Monta o parser da CLI (reutilizado pelo benchmark)."""
     parser = argparse.ArgumentParser(
         description="Operações batch no Notion",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -406,13 +2156,15 @@ Exemplos:
   %(prog)s --action stats --database all
   %(prog)s --action archive --database personal --older-than 90 --dry-run
   %(prog)s --action update-status --database work --status "Concluído" --filter "tag:hackathon"
+  %(prog)s --action move --database personal --target studies --filter "tag:estudos"
+  %(prog)s --action export --database studies --output studies.parquet
         """,
     )
 
     parser.add_argument(
         "--action",
         required=True,
-        choices=["list", "stats", "archive", "update-status"],
+        choices=list(ACTIONS),
         help="Ação a executar",
     )
     parser.add_argument(
@@ -428,6 +2180,10 @@ Exemplos:
         "--filter",
         help="Filtro (key:value, ex: tag:hackathon, status:pendente)",
     )
+    parser.add_argument(
+        "--target",
+        help="Database destino (para move)",
+    )
     parser.add_argument(
         "--older-than",
         type=int,
@@ -445,27 +2201,126 @@ Exemplos:
         action="store_true",
         help="Simular sem fazer alterações",
     )
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=10,
+        help="Máximo de conexões keep-alive no pool HTTP (default: 10)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Requisições simultâneas em lote e databases consultadas em paralelo (default: 4)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=3.0,
+        help="Limite de requisições por segundo (default: 3.0, 0 desativa)",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=5,
+        help="Tentativas extras em 429, 5xx e erros de rede (default: 5)",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        help="Arquivo de journal para retomar update-status (default: ~/.cache/.../journals)",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Manter só id/título/status/datas de cada página (menos memória)",
+    )
+    parser.add_argument(
+        "--mirror",
+        action="store_true",
+        help="Ler de um espelho local (SQLite) sincronizado incrementalmente",
+    )
+    parser.add_argument(
+        "--full-sync",
+        action="store_true",
+        help="Forçar sincronização completa do espelho (para --mirror)",
+    )
+    parser.add_argument(
+        "--mirror-path",
+        type=Path,
+        default=Path(os.getenv("NOTION_MIRROR_PATH", str(DEFAULT_MIRROR_PATH))),
+        help="Arquivo SQLite do espelho (default: NOTION_MIRROR_PATH ou ~/.cache)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Arquivo de saída (para export, default: notion-<database>.<formato>)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["auto", *EXPORT_FORMATS],
+        default="auto",
+        help="Formato do export (default: extensão de --output, ou parquet se houver pyarrow)",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Mostrar métricas das requisições ao final (latência por endpoint, bytes, status)",
+    )
+    parser.add_argument(
+        "--metrics-json",
+        type=Path,
+        help="Gravar as métricas das requisições em JSON neste arquivo ao final",
+    )
+    return parser
+
 
+def main():
+    parser = build_parser()
     args = parser.parse_args()
 
+    if args.action == "update-status" and not args.status:
+        parser.error("--status é obrigatório para update-status")
+    if args.action == "move" and (not args.target or args.database == "all"):
+        parser.error("move exige --database de origem e --target")
+    if args.action == "export" and args.database == "all":
+        parser.error("export exige uma database (--database studies, work, ...)")
+
     try:
-        notion = NotionBatch()
+        notion = NotionBatch(
+            pool_size=max(args.pool_size, args.workers),
+            rate_limit=args.rate_limit,
+            mirror=NotionMirror(args.mirror_path) if args.mirror else None,
+            max_retries=args.max_retries,
+            mirror_path=args.mirror_path,
+        )
     except ValueError as e:
         print(f"❌ Erro: {e}")
         sys.exit(1)
 
-    actions = {
-        "list": cmd_list,
-        "stats": cmd_stats,
-        "archive": cmd_archive,
-        "update-status": cmd_update_status,
-    }
-
-    action_func = actions.get(args.action)
-    if action_func:
-        action_func(notion, args)
-    else:
+    action_func = ACTIONS.get(args.action)
+    if not action_func:
         parser.print_help()
+        return
+
+    metrics = None
+    if args.metrics or args.metrics_json:
+        metrics = RequestMetrics()
+        notion.add_hook(metrics)
+
+    with notion:
+        try:
+            action_func(notion, args)
+        except NotionAPIError as e:
+            print(f"❌ Erro: {e}")
+            sys.exit(1)
+        finally:
+            print_run_summary(notion)
+            if args.metrics:
+                print_metrics(metrics)
+            if args.metrics_json:
+                args.metrics_json.write_text(json.dumps(metrics.to_dict(), indent=2))
+                print(f"📈 Métricas gravadas em {args.metrics_json}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Notion Batch Benchmark
+
+Mede o throughput do notion_batch.py contra o servidor fake local
+(notion_fake_server.py), sem tocar a API real. Cada cenário roda em um
+processo separado para que o pico de memória (RSS) seja só do cliente.
+
+Reporta, por tamanho e cenário: tempo total, requisições, req/s e pico de RSS.
+
+Uso:
+    python core/scripts/notion/notion_benchmark.py
+    python core/scripts/notion/notion_benchmark.py --sizes 1000,10000 --scenarios list,stats
+    python core/scripts/notion/notion_benchmark.py --latency 20 --throttle-every 50
+    python core/scripts/notion/notion_benchmark.py --client-args "--compact --workers 8" --json
+"""
+
+import argparse
+import json
+import os
+import resource
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Dict, List
+
+from notion_fake_server import start_server
+
+DATABASE_NAME = "bench"
+DATABASE_ID = "00000000-0000-4000-8000-00000000bench"
+
+# Argumentos da CLI do notion_batch.py por cenário (--client-args é somado depois)
+SCENARIOS = {
+    "list": ["--action", "list", "--database", DATABASE_NAME, "--limit", "50"],
+    "stats": ["--action", "stats", "--database", DATABASE_NAME],
+    "archive": ["--action", "archive", "--database", DATABASE_NAME, "--older-than", "180"],
+}
+
+
+def peak_rss_mb() -> float:
+    """Pico de RSS do processo atual em MB (ru_maxrss é KB no Linux, bytes no macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_worker(base_url: str, client_args: List[str]) -> Dict[str, Any]:
+    """Executa um cenário no processo atual (modo --worker) e retorna as métricas."""
+    from notion_batch import ACTIONS, NotionBatch, NotionMirror, build_parser
+
+    args = build_parser().parse_args(client_args)
+    notion = NotionBatch(
+        token="benchmark",
+        base_url=base_url,
+        pool_size=max(args.pool_size, args.workers),
+        rate_limit=args.rate_limit,
+        mirror=NotionMirror(args.mirror_path) if args.mirror else None,
+        max_retries=args.max_retries,
+        mirror_path=args.mirror_path,
+    )
+    notion.database_ids = {DATABASE_NAME: DATABASE_ID}
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull), notion:
+        started = time.perf_counter()
+        ACTIONS[args.action](notion, args)
+        wall = time.perf_counter() - started
+
+    return {
+        "wall": wall,
+        "requests": notion.request_count,
+        "retries": notion.retry_count,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_scenario(base_url: str, scenario: str, client_args: List[str]) -> Dict[str, Any]:
+    """Roda um cenário em um subprocesso e lê as métricas do stdout."""
+    command = [
+        sys.executable,
+        str(Path(__file__).resolve()),
+        "--worker",
+        "--base-url",
+        base_url,
+        "--client-args",
+        shlex.join(SCENARIOS[scenario] + ["--rate-limit", "0"] + client_args),
+    ]
+    # HOME isolado por execução: journals e espelho de um cenário não podem
+    # vazar para o seguinte (nem tocar o ~/.cache de quem roda o benchmark)
+    with tempfile.TemporaryDirectory(prefix="notion-bench-") as home:
+        env = {**os.environ, "HOME": home, "XDG_CACHE_HOME": str(Path(home) / ".cache")}
+        env.pop("NOTION_MIRROR_PATH", None)
+        result = subprocess.run(command, capture_output=True, text=True, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"Cenário {scenario} falhou:\n{result.stderr}")
+
+    metrics = json.loads(result.stdout.strip().splitlines()[-1])
+    metrics["req_per_sec"] = metrics["requests"] / metrics["wall"] if metrics["wall"] else 0.0
+    return metrics
+
+
+def print_report(rows: List[Dict[str, Any]]) -> None:
+    """Tabela com os resultados."""
+    print(f"\n{'='*78}")
+    print("BENCHMARK NOTION_BATCH (servidor fake local)")
+    print(f"{'='*78}\n")
+    print(f"{'Páginas':>8} {'Cenário':<8} {'Tempo (s)':>10} {'Requisições':>12} "
+          f"{'Req/s':>9} {'Retries':>8} {'Pico RSS (MB)':>14}")
+    print("-" * 78)
+    for row in rows:
+        print(
+            f"{row['pages']:>8} {row['scenario']:<8} {row['wall']:>10.2f} {row['requests']:>12} "
+            f"{row['req_per_sec']:>9.1f} {row['retries']:>8} {row['peak_rss_mb']:>14.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark do notion_batch.py contra um servidor fake local",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplos:
+  %(prog)s
+  %(prog)s --sizes 1000,10000 --scenarios list,stats
+  %(prog)s --latency 20 --throttle-every 50
+  %(prog)s --client-args "--compact --workers 8" --json
+        """,
+    )
+    parser.add_argument(
+        "--sizes",
+        default="1000,10000,100000",
+        help="Páginas sintéticas por execução (default: 1000,10000,100000)",
+    )
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Cenários a executar (default: {','.join(SCENARIOS)})",
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Latência do servidor em ms (default: 0)"
+    )
+    parser.add_argument(
+        "--throttle-every",
+        type=int,
+        default=0,
+        help="Servidor responde 429 a cada N requisições (default: 0, desativado)",
+    )
+    parser.add_argument(
+        "--client-args",
+        default="",
+        help="Argumentos extras para o notion_batch.py (ex: \"--compact --workers 8\")",
+    )
+    parser.add_argument("--json", action="store_true", help="Saída em JSON")
+    # Modo interno: executa um único cenário e imprime as métricas em JSON
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.base_url, shlex.split(args.client_args))))
+        return
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    scenarios = [name for name in args.scenarios.split(",") if name]
+    unknown = [name for name in scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"Cenários desconhecidos: {', '.join(unknown)}")
+
+    rows = []
+    for size in sizes:
+        # Servidor novo por tamanho: archive altera o estado das páginas
+        server = start_server(
+            size, latency=args.latency / 1000, throttle_every=args.throttle_every, retry_after=0.1
+        )
+        try:
+            for scenario in scenarios:
+                if not args.json:
+                    print(f"⏳ {size} páginas: {scenario}...", flush=True)
+                metrics = run_scenario(server.base_url, scenario, shlex.split(args.client_args))
+                rows.append({"pages": size, "scenario": scenario, **metrics})
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+    else:
+        print_report(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+"""
+Notion Fake Server
+
+Servidor HTTP local que imita o subconjunto da API do Notion usado pelo
+notion_batch.py, com páginas sintéticas geradas sob demanda:
+- POST /v1/databases/{id}/query (paginação por cursor + filtros de timestamp,
+  status/select, title, multi_select e rich_text, com and/or)
+- GET /v1/databases/{id} (schema com as opções de status)
+- PATCH /v1/pages/{id} (propriedades e archived)
+- POST /v1/pages (criação em uma database, com `children`)
+- GET/PATCH /v1/blocks/{id}/children (conteúdo paginado por cursor e append;
+  blocos aninhados enviados na criação são achatados)
+- Respostas 429 com Retry-After a cada N requisições e latência configurável
+
+Útil para medir throughput sem tocar a API real (ver notion_benchmark.py).
+`sorts` é ignorado: as páginas são sempre retornadas na ordem de criação.
+
+Uso:
+    python core/scripts/notion/notion_fake_server.py --pages 10000
+    python core/scripts/notion/notion_fake_server.py --pages 1000 --latency 50 --throttle-every 20
+
+    NOTION_API_BASE_URL=http://127.0.0.1:8765/v1 NOTION_API_KEY=fake \\
+        python core/scripts/notion/notion_batch.py --action stats --database studies
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+STATUSES = ("Não iniciado", "Em andamento", "Concluído")
+TAGS = ("hackathon", "estudos", "trabalho", "pessoal")
+
+
+def format_timestamp(value: datetime) -> str:
+    """Formata no padrão do Notion (UTC, milissegundos, sufixo Z)."""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Lê timestamps ISO 8601; valores sem timezone são tratados como UTC."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def read_rich_text(items: List[Dict]) -> List[Dict]:
+    """Rich text no formato de escrita → formato de leitura (com `plain_text`)."""
+    return [{**item, "plain_text": item.get("text", {}).get("content", "")} for item in items]
+
+
+class FakeDatabase:
+    """
+    Database sintética com `size` páginas geradas sob demanda.
+
+    Só as mutações (PATCH) e as páginas criadas via POST ficam em memória,
+    então 100k páginas não custam 100k dicts no servidor. Páginas criadas
+    recebem os índices seguintes às geradas.
+    """
+
+    def __init__(
+        self, database_id: str, number: int, size: int, now: datetime, blocks_per_page: int = 3
+    ):
+        self.database_id = database_id
+        self.number = number
+        self.size = size
+        self.now = now
+        self.blocks_per_page = blocks_per_page
+        self.archived: set = set()
+        self.overrides: Dict[int, Dict[str, Any]] = {}
+        self.created: List[Dict] = []
+        self.created_blocks: Dict[int, List[Dict]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        return self.size + len(self.created)
+
+    def page_id(self, index: int) -> str:
+        return f"{self.number:08x}-0000-4000-8000-{index:012x}"
+
+    def schema(self) -> Dict:
+        return {
+            "object": "database",
+            "id": self.database_id,
+            "title": [{"plain_text": f"Fake {self.number}"}],
+            "properties": {
+                "Name": {"id": "title", "name": "Name", "type": "title", "title": {}},
+                "Status": {
+                    "id": "st",
+                    "name": "Status",
+                    "type": "status",
+                    "status": {"options": [{"name": name} for name in STATUSES]},
+                },
+                "Tags": {
+                    "id": "tg",
+                    "name": "Tags",
+                    "type": "multi_select",
+                    "multi_select": {"options": [{"name": name} for name in TAGS]},
+                },
+            },
+        }
+
+    def page(self, index: int) -> Dict:
+        """Gera a página `index` (determinística) aplicando as mutações já recebidas."""
+        if index >= self.size:
+            page = dict(self.created[index - self.size])
+            page["archived"] = index in self.archived
+            return page
+
+        override = self.overrides.get(index, {})
+        title = f"Card {index}"
+        created = self.now - timedelta(days=400, minutes=self.size - index)
+        last_edited = override.get("last_edited_time") or (
+            self.now - timedelta(days=index % 365, minutes=index % 1440)
+        )
+
+        return {
+            "object": "page",
+            "id": self.page_id(index),
+            "created_time": format_timestamp(created),
+            "last_edited_time": format_timestamp(last_edited),
+            "created_by": {"object": "user", "id": "00000000-0000-4000-8000-000000000001"},
+            "last_edited_by": {"object": "user", "id": "00000000-0000-4000-8000-000000000001"},
+            "archived": index in self.archived,
+            "parent": {"type": "database_id", "database_id": self.database_id},
+            "url": f"https://www.notion.so/{self.page_id(index).replace('-', '')}",
+            "properties": {
+                "Name": {
+                    "id": "title",
+                    "type": "title",
+                    "title": [
+                        {
+                            "type": "text",
+                            "text": {"content": title, "link": None},
+                            "annotations": {"bold": False, "italic": False, "color": "default"},
+                            "plain_text": title,
+                            "href": None,
+                        }
+                    ],
+                },
+                "Status": {
+                    "id": "st",
+                    "type": "status",
+                    "status": {
+                        "id": "opt",
+                        "name": override.get("status") or STATUSES[index % len(STATUSES)],
+                        "color": "default",
+                    },
+                },
+                "Tags": {
+                    "id": "tg",
+                    "type": "multi_select",
+                    "multi_select": [{"id": "tag", "name": TAGS[index % len(TAGS)]}],
+                },
+            },
+        }
+
+    def query(self, body: Dict) -> Dict:
+        """Uma página de resultados a partir do cursor (índice da próxima página)."""
+        page_size = min(int(body.get("page_size", 100)), 100)
+        index = int(body.get("start_cursor") or 0)
+        filter_obj = body.get("filter")
+
+        results: List[Dict] = []
+        while index < self.total and len(results) < page_size:
+            if index not in self.archived:
+                page = self.page(index)
+                if matches(page, filter_obj):
+                    results.append(page)
+            index += 1
+
+        has_more = index < self.total
+        return {
+            "object": "list",
+            "results": results,
+            "has_more": has_more,
+            "next_cursor": str(index) if has_more else None,
+        }
+
+    def create(self, body: Dict) -> Dict:
+        """Cria uma página com as propriedades (formato de escrita) e os blocos enviados."""
+        now = format_timestamp(datetime.now(timezone.utc))
+        properties = {}
+        for name, prop in body.get("properties", {}).items():
+            prop_type, value = next(iter(prop.items()))
+            if prop_type in ("title", "rich_text"):
+                value = read_rich_text(value)
+            properties[name] = {"id": name[:4].lower(), "type": prop_type, prop_type: value}
+
+        with self._lock:
+            index = self.total
+            page = {
+                "object": "page",
+                "id": self.page_id(index),
+                "created_time": now,
+                "last_edited_time": now,
+                "archived": False,
+                "parent": {"type": "database_id", "database_id": self.database_id},
+                "url": f"https://www.notion.so/{self.page_id(index).replace('-', '')}",
+                "properties": properties,
+            }
+            self.created.append(page)
+            self.created_blocks[index] = []
+        self.append_blocks(index, body.get("children", []))
+        return page
+
+    def blocks(self, index: int) -> List[Dict]:
+        """Conteúdo da página `index` (gerado, ou o recebido na criação/append)."""
+        if index in self.created_blocks:
+            return self.created_blocks[index]
+        blocks = []
+        for number in range(self.blocks_per_page):
+            text = f"Parágrafo {number} do card {index}"
+            rich_text = {"type": "text", "text": {"content": text, "link": None}, "plain_text": text}
+            blocks.append(
+                {
+                    "object": "block",
+                    "id": f"{self.number:08x}-{number:04x}-4000-9000-{index:012x}",
+                    "type": "paragraph",
+                    "has_children": False,
+                    "paragraph": {"rich_text": [rich_text]},
+                }
+            )
+        return blocks
+
+    def append_blocks(self, index: int, children: List[Dict]) -> List[Dict]:
+        """Adiciona blocos ao final do conteúdo (páginas geradas passam a ser materializadas)."""
+        with self._lock:
+            content = self.created_blocks.setdefault(index, self.blocks(index))
+            added = []
+            for block in children:
+                block_type = block["type"]
+                data = {key: value for key, value in block[block_type].items() if key != "children"}
+                if "rich_text" in data:
+                    data["rich_text"] = read_rich_text(data["rich_text"])
+                added.append(
+                    {
+                        "object": "block",
+                        "id": f"{self.number:08x}-{len(content):04x}-4000-9000-{index:012x}",
+                        "type": block_type,
+                        "has_children": False,
+                        block_type: data,
+                    }
+                )
+                content.append(added[-1])
+        return added
+
+    def children(self, index: int, start_cursor: Optional[str], page_size: int) -> Dict:
+        """Uma página de blocos a partir do cursor (posição do próximo bloco)."""
+        blocks = self.blocks(index)
+        start = int(start_cursor or 0)
+        end = start + min(page_size, 100)
+        has_more = end < len(blocks)
+        return {
+            "object": "list",
+            "results": blocks[start:end],
+            "has_more": has_more,
+            "next_cursor": str(end) if has_more else None,
+        }
+
+    def patch(self, index: int, body: Dict) -> Dict:
+        with self._lock:
+            override = self.overrides.setdefault(index, {})
+            if body.get("archived"):
+                self.archived.add(index)
+            status = body.get("properties", {}).get("Status", {}).get("status")
+            if status:
+                override["status"] = status.get("name")
+            override["last_edited_time"] = datetime.now(timezone.utc)
+        page = self.page(index)
+        page["archived"] = index in self.archived
+        return page
+
+
+def matches(page: Dict, filter_obj: Optional[Dict]) -> bool:
+    """Avalia um filtro da API do Notion (subconjunto) sobre uma página."""
+    if not filter_obj:
+        return True
+    if "or" in filter_obj:
+        return any(matches(page, sub) for sub in filter_obj["or"])
+    if "and" in filter_obj:
+        return all(matches(page, sub) for sub in filter_obj["and"])
+
+    timestamp = filter_obj.get("timestamp")
+    if timestamp in ("created_time", "last_edited_time"):
+        value = parse_timestamp(page[timestamp])
+        for operator, target in filter_obj.get(timestamp, {}).items():
+            target_date = parse_timestamp(target)
+            if operator == "before" and not value < target_date:
+                return False
+            if operator == "after" and not value > target_date:
+                return False
+            if operator == "on_or_before" and not value <= target_date:
+                return False
+            if operator == "on_or_after" and not value >= target_date:
+                return False
+        return True
+
+    prop = page["properties"].get(filter_obj.get("property"), {})
+    for prop_type in ("status", "select", "multi_select", "title", "rich_text"):
+        if prop_type not in filter_obj:
+            continue
+        condition = filter_obj[prop_type]
+        if prop_type in ("status", "select"):
+            values = [(prop.get(prop_type) or {}).get("name", "")]
+        elif prop_type == "multi_select":
+            values = [option["name"] for option in prop.get("multi_select", [])]
+        else:
+            values = ["".join(item["plain_text"] for item in prop.get(prop_type, []))]
+
+        if "equals" in condition:
+            return condition["equals"] in values
+        if "does_not_equal" in condition:
+            return condition["does_not_equal"] not in values
+        if "contains" in condition:
+            if prop_type == "multi_select":
+                return condition["contains"] in values
+            return any(condition["contains"].lower() in value.lower() for value in values)
+    return True
+
+
+class FakeNotionServer(ThreadingHTTPServer):
+    """Servidor com uma FakeDatabase por database_id consultado."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        pages: int,
+        latency: float = 0.0,
+        throttle_every: int = 0,
+        retry_after: float = 1.0,
+        blocks_per_page: int = 3,
+    ):
+        """
+        Args:
+            address: (host, porta); porta 0 escolhe uma livre
+            pages: Páginas por database
+            latency: Atraso (segundos) aplicado a cada requisição
+            throttle_every: Responder 429 a cada N requisições (0 desativa)
+            retry_after: Valor do header Retry-After nas respostas 429
+            blocks_per_page: Blocos de conteúdo de cada página gerada
+        """
+        super().__init__(address, FakeNotionHandler)
+        self.pages = pages
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.blocks_per_page = blocks_per_page
+        self.now = datetime.now(timezone.utc)
+        self.databases: Dict[str, FakeDatabase] = {}
+        self.request_count = 0
+        self.throttled_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def database(self, database_id: str) -> FakeDatabase:
+        with self._lock:
+            if database_id not in self.databases:
+                number = len(self.databases) + 1
+                self.databases[database_id] = FakeDatabase(
+                    database_id, number, self.pages, self.now, self.blocks_per_page
+                )
+            return self.databases[database_id]
+
+    def find_page(self, page_id: str) -> Optional[Tuple[FakeDatabase, int]]:
+        match = re.fullmatch(r"([0-9a-f]{8})-0000-4000-8000-([0-9a-f]{12})", page_id)
+        if not match:
+            return None
+        number, index = int(match.group(1), 16), int(match.group(2), 16)
+        for database in list(self.databases.values()):
+            if database.number == number and index < database.total:
+                return database, index
+        return None
+
+    def should_throttle(self) -> bool:
+        with self._lock:
+            self.request_count += 1
+            if self.throttle_every and self.request_count % self.throttle_every == 0:
+                self.throttled_count += 1
+                return True
+        return False
+
+
+class FakeNotionHandler(BaseHTTPRequestHandler):
+    """Rotas da API fake (keep-alive habilitado)."""
+
+    protocol_version = "HTTP/1.1"
+    # Headers e corpo saem em writes separados: sem TCP_NODELAY o delayed ACK domina
+    disable_nagle_algorithm = True
+    server: FakeNotionServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, payload: Dict, status: int = 200, headers: Optional[Dict] = None) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}") if length else {}
+
+    def _not_found(self) -> None:
+        self._send({"object": "error", "status": 404, "code": "object_not_found"}, 404)
+
+    def _handle(self, method: str) -> None:
+        body = self._read_body()
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        if self.server.should_throttle():
+            self._send(
+                {"object": "error", "status": 429, "code": "rate_limited"},
+                429,
+                {"Retry-After": str(self.server.retry_after)},
+            )
+            return
+
+        url = urlsplit(self.path)
+        query = {name: values[0] for name, values in parse_qs(url.query).items()}
+        parts = url.path.strip("/").split("/")
+        if parts == ["v1", "pages"] and method == "POST":
+            database_id = body.get("parent", {}).get("database_id")
+            if not database_id:
+                self._not_found()
+                return
+            self._send(self.server.database(database_id).create(body))
+            return
+        if len(parts) < 3 or parts[0] != "v1":
+            self._not_found()
+            return
+
+        resource, object_id = parts[1], parts[2]
+        if resource == "blocks" and parts[3:] == ["children"]:
+            found = self.server.find_page(object_id)
+            if not found:
+                self._not_found()
+                return
+            database, index = found
+            if method == "GET":
+                page_size = int(query.get("page_size", 100))
+                self._send(database.children(index, query.get("start_cursor"), page_size))
+            elif method == "PATCH":
+                added = database.append_blocks(index, body.get("children", []))
+                self._send({"object": "list", "results": added, "has_more": False})
+            else:
+                self._not_found()
+        elif resource == "databases" and method == "POST" and parts[3:] == ["query"]:
+            self._send(self.server.database(object_id).query(body))
+        elif resource == "databases" and method == "GET" and len(parts) == 3:
+            self._send(self.server.database(object_id).schema())
+        elif resource == "pages" and method == "PATCH":
+            found = self.server.find_page(object_id)
+            if not found:
+                self._not_found()
+                return
+            database, index = found
+            self._send(database.patch(index, body))
+        else:
+            self._not_found()
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_PATCH(self) -> None:
+        self._handle("PATCH")
+
+
+def start_server(
+    pages: int,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency: float = 0.0,
+    throttle_every: int = 0,
+    retry_after: float = 1.0,
+    blocks_per_page: int = 3,
+) -> FakeNotionServer:
+    """Sobe o servidor em uma thread daemon (encerrar com `server.shutdown()`)."""
+    server = FakeNotionServer(
+        (host, port), pages, latency, throttle_every, retry_after, blocks_per_page
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Servidor fake da API do Notion para testes e benchmarks",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Exemplos:
+  %(prog)s --pages 10000
+  %(prog)s --pages 1000 --latency 50 --throttle-every 20
+        """,
+    )
+    parser.add_argument("--pages", type=int, default=1000, help="Páginas por database")
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Porta (default: 8765)")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Latência por requisição em ms (default: 0)"
+    )
+    parser.add_argument(
+        "--throttle-every",
+        type=int,
+        default=0,
+        help="Responder 429 a cada N requisições (default: 0, desativado)",
+    )
+    parser.add_argument(
+        "--retry-after",
+        type=float,
+        default=1.0,
+        help="Retry-After (segundos) das respostas 429 (default: 1)",
+    )
+    parser.add_argument(
+        "--blocks", type=int, default=3, help="Blocos de conteúdo por página (default: 3)"
+    )
+
+    args = parser.parse_args()
+
+    server = FakeNotionServer(
+        (args.host, args.port),
+        args.pages,
+        latency=args.latency / 1000,
+        throttle_every=args.throttle_every,
+        retry_after=args.retry_after,
+        blocks_per_page=args.blocks,
+    )
+    print(f"🧪 Notion fake em {server.base_url} ({args.pages} páginas por database)")
+    print(f"   NOTION_API_BASE_URL={server.base_url} NOTION_API_KEY=fake ...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"\n{server.request_count} requisições, {server.throttled_count} com 429")
+
+
+if __name__ == "__main__":
+    main()